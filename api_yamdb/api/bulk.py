@@ -0,0 +1,125 @@
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
+
+from reviews.models import Category, Genre, Genre_Title, Title, normalize_name
+from reviews.rankings import refresh_rankings
+from reviews.signals import catalog_changed
+
+from .serializers import TitleBulkItemSerializer
+
+UPDATE_FIELDS = ('name', 'name_normalized', 'year', 'description', 'category')
+
+
+REFERENCE_FIELDS = ('id', 'genre', 'category')
+
+
+def get_references(item, serializer, item_errors):
+    if not item_errors:
+        return serializer.validated_data
+    references = {}
+    if not isinstance(item, dict):
+        return references
+    for field in REFERENCE_FIELDS:
+        if field in item and field not in item_errors:
+            try:
+                references[field] = serializer.fields[field].run_validation(
+                    item[field]
+                )
+            except ValidationError:
+                pass
+    return references
+
+
+def validate_titles(items):
+    serializers = [
+        TitleBulkItemSerializer(
+            data=item, partial=isinstance(item, dict) and 'id' in item
+        )
+        for item in items
+    ]
+    errors = [
+        {} if serializer.is_valid() else dict(serializer.errors)
+        for serializer in serializers
+    ]
+    rows = [
+        get_references(item, serializer, item_errors)
+        for item, serializer, item_errors in zip(items, serializers, errors)
+    ]
+    genres = Genre.objects.in_bulk(
+        {slug for row in rows for slug in row.get('genre', ())},
+        field_name='slug',
+    )
+    categories = Category.objects.in_bulk(
+        {row['category'] for row in rows if 'category' in row},
+        field_name='slug',
+    )
+    titles = Title.objects.in_bulk(
+        {row['id'] for row in rows if 'id' in row}
+    )
+    seen = set()
+    for row, item_errors in zip(rows, errors):
+        if 'id' in row:
+            if row['id'] not in titles:
+                item_errors['id'] = ['Произведение не найдено.']
+            elif row['id'] in seen:
+                item_errors['id'] = [
+                    'Произведение уже встречается в этом запросе.'
+                ]
+            seen.add(row['id'])
+        missing = [slug for slug in row.get('genre', ()) if slug not in genres]
+        if missing:
+            item_errors['genre'] = [
+                f'Жанр {slug} не найден.' for slug in missing
+            ]
+        if 'category' in row and row['category'] not in categories:
+            item_errors['category'] = [
+                f'Категория {row["category"]} не найдена.'
+            ]
+    return rows, errors, genres, categories, titles
+
+
+def apply_row(title, row, categories):
+    for field in ('name', 'year', 'description'):
+        if field in row:
+            setattr(title, field, row[field])
+    if 'category' in row:
+        title.category = categories[row['category']]
+    title.name_normalized = normalize_name(title.name)
+    return title
+
+
+def save_titles(items):
+    rows, errors, genres, categories, titles = validate_titles(items)
+    if any(errors):
+        return None, errors
+    result = [
+        apply_row(
+            titles[row['id']] if 'id' in row else Title(description=''),
+            row,
+            categories,
+        )
+        for row in rows
+    ]
+    created = [title for title in result if title.pk is None]
+    updated = [title for title in result if title.pk is not None]
+    with transaction.atomic():
+        if connection.features.can_return_rows_from_bulk_insert:
+            Title.objects.bulk_create(created)
+        else:
+            for title in created:
+                title.save(force_insert=True)
+        Title.objects.bulk_update(updated, UPDATE_FIELDS)
+        Genre_Title.objects.filter(
+            title_id__in=[
+                row['id'] for row in rows if 'id' in row and 'genre' in row
+            ]
+        ).delete()
+        Genre_Title.objects.bulk_create(
+            Genre_Title(title_id=title, genre_id=genres[slug])
+            for title, row in zip(result, rows)
+            for slug in dict.fromkeys(row.get('genre', ()))
+        )
+        title_ids = [title.pk for title in result]
+        refresh_rankings(Title.objects.filter(pk__in=title_ids))
+        catalog_changed.send(sender=Title, title_ids=title_ids)
+    return result, errors
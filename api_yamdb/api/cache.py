@@ -0,0 +1,104 @@
+from hashlib import md5
+from time import time, time_ns
+
+from django.conf import settings
+from django.core.cache import caches
+
+from api.pagination import KeysetPagination
+
+VERSION_KEY = 'api:version:{}'
+MODIFIED_KEY = 'api:modified:{}'
+RESPONSE_KEY = 'api:response:{}'
+GLOBAL_NAMESPACE = 'catalog'
+SHAPE_QUERY_PARAMS = (KeysetPagination.cursor_query_param,)
+PROCESS_LOCAL_BACKENDS = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+def get_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def is_process_local(alias):
+    return settings.CACHES[alias]['BACKEND'] in PROCESS_LOCAL_BACKENDS
+
+
+def is_shared_cache():
+    return (
+        settings.API_CACHE_SINGLE_PROCESS
+        or not is_process_local(settings.API_CACHE_ALIAS)
+    )
+
+
+def initial_version():
+    return time_ns() // 1000
+
+
+def get_versions(namespaces):
+    cache = get_cache()
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for namespace, key in zip(namespaces, keys):
+        if key not in versions:
+            cache.add(MODIFIED_KEY.format(namespace), time(), None)
+            cache.add(key, initial_version(), None)
+            versions[key] = cache.get(key)
+            if versions[key] is None:
+                return None
+    return [versions[key] for key in keys]
+
+
+def get_last_modified(namespaces):
+    modified = get_cache().get_many(
+        [MODIFIED_KEY.format(namespace) for namespace in namespaces]
+    )
+    if len(modified) < len(namespaces):
+        return None
+    last_modified = int(max(modified.values()))
+    if last_modified >= int(time()):
+        return None
+    return last_modified
+
+
+def bump(*namespaces):
+    cache = get_cache()
+    now = time()
+    cache.set_many(
+        {MODIFIED_KEY.format(namespace): now for namespace in namespaces},
+        None,
+    )
+    for namespace in namespaces:
+        key = VERSION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, initial_version(), None)
+
+
+def normalize_query(query_params):
+    return sorted(
+        (key, sorted(value for value in values if value))
+        for key, values in query_params.lists()
+        if any(values) or key in SHAPE_QUERY_PARAMS
+    )
+
+
+def fingerprint(request, namespaces):
+    namespaces = (GLOBAL_NAMESPACE, *namespaces)
+    versions = get_versions(namespaces)
+    if versions is None:
+        return None
+    raw = repr((
+        request.get_host(),
+        request.path,
+        normalize_query(request.query_params),
+        getattr(request, 'accepted_media_type', None),
+        list(zip(namespaces, versions)),
+    ))
+    return md5(raw.encode()).hexdigest()
+
+
+def response_key(request, namespaces):
+    key = fingerprint(request, namespaces)
+    if key is None:
+        return None
+    return RESPONSE_KEY.format(key)
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from api.cache import is_process_local
+
+
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    if settings.API_CACHE_SINGLE_PROCESS:
+        return []
+    warnings = []
+    for setting in ('API_CACHE_ALIAS', 'AUTH_VERSION_CACHE_ALIAS'):
+        alias = getattr(settings, setting)
+        if is_process_local(alias):
+            warnings.append(Warning(
+                f'Кэш `{alias}` из {setting} виден только текущему '
+                'процессу: при нескольких воркерах сброс кэша и отзыв '
+                'токенов не дойдут до остальных.',
+                hint=(
+                    'Укажите общий бэкенд через CACHE_BACKEND и '
+                    'CACHE_LOCATION или, если API обслуживает один процесс, '
+                    'задайте API_CACHE_SINGLE_PROCESS=1.'
+                ),
+                id='api.W001',
+            ))
+    return warnings
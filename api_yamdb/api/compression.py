@@ -0,0 +1,55 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+RESPONSE_LEVELS = {'br': 5, 'gzip': 6}
+STATIC_LEVELS = {'br': 11, 'gzip': 9}
+
+
+def gzip_compress(data, level):
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def brotli_compress(data, level):
+    return brotli.compress(data, quality=level)
+
+
+def get_encoders():
+    encoders = {}
+    if brotli is not None:
+        encoders['br'] = brotli_compress
+    encoders['gzip'] = gzip_compress
+    return encoders
+
+
+def parse_accept_encoding(header):
+    weights = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+    return weights
+
+
+def negotiate(header):
+    weights = parse_accept_encoding(header)
+    default = weights.get('*', 0.0)
+    best, best_weight = None, 0.0
+    for coding in get_encoders():
+        weight = weights.get(coding, default)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
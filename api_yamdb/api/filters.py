@@ -1,5 +1,7 @@
 import django_filters
-from reviews.models import Title
+from reviews.models import Title, normalize_name
+
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
 
 
 class TitleFilter(django_filters.FilterSet):
@@ -10,7 +12,36 @@ class TitleFilter(django_filters.FilterSet):
         field_name='genre__slug', lookup_expr='icontains'
     )
     name = django_filters.CharFilter(lookup_expr='icontains')
+    category_slug = django_filters.CharFilter(field_name='category__slug')
+    genre_slug = django_filters.CharFilter(field_name='genre__slug')
+    name_prefix = django_filters.CharFilter(method='filter_name_prefix')
+
+    class Meta:
+        model = Title
+        fields = [
+            'category',
+            'genre',
+            'name',
+            'year',
+            'category_slug',
+            'genre_slug',
+            'name_prefix',
+        ]
+
+    def filter_name_prefix(self, queryset, name, value):
+        prefix = normalize_name(value)
+        return queryset.filter(
+            name_normalized__gte=prefix,
+            name_normalized__lt=prefix + PREFIX_UPPER_BOUND,
+        )
+
+
+class LeaderboardFilter(django_filters.FilterSet):
+    category = django_filters.CharFilter(
+        field_name='ranking__category__slug'
+    )
+    genre = django_filters.CharFilter(field_name='genre__slug')
 
     class Meta:
         model = Title
-        fields = ['category', 'genre', 'name', 'year']
+        fields = ['category', 'genre']
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.compression import EXTENSIONS, STATIC_LEVELS, get_encoders
+
+
+class Command(BaseCommand):
+    help = (
+        'Сжимает файлы static/ в соседние .gz и .br, чтобы веб-сервер '
+        'отдавал их без сжатия на каждый запрос.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            action='append',
+            help='Каталог со статикой; по умолчанию STATICFILES_DIRS.',
+        )
+        parser.add_argument(
+            '--min-size',
+            type=int,
+            default=settings.COMPRESSION_MIN_SIZE,
+            help='Файлы меньше этого размера в байтах не сжимаются.',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Пересжать файлы, даже если архивы не устарели.',
+        )
+
+    def handle(self, *args, **options):
+        roots = [Path(path) for path in (
+            options['path'] or settings.STATICFILES_DIRS
+        )]
+        for root in roots:
+            if not root.is_dir():
+                raise CommandError(f'Каталог {root} не найден.')
+        suffixes = set(EXTENSIONS.values())
+        written = skipped = 0
+        for root in roots:
+            for source in sorted(root.rglob('*')):
+                if (
+                    source.is_file() and source.suffix not in suffixes
+                    and source.stat().st_size >= options['min_size']
+                ):
+                    done, unchanged = self.compress_file(
+                        root, source, options['force']
+                    )
+                    written += done
+                    skipped += unchanged
+        self.stdout.write(self.style.SUCCESS(
+            f'Сжато файлов: {written}, без изменений: {skipped}.'
+        ))
+
+    def compress_file(self, root, source, force):
+        mtime = source.stat().st_mtime
+        data = None
+        written = skipped = 0
+        for encoding, compress in get_encoders().items():
+            target = source.with_name(source.name + EXTENSIONS[encoding])
+            if (
+                not force and target.exists()
+                and target.stat().st_mtime >= mtime
+            ):
+                skipped += 1
+                continue
+            if data is None:
+                data = source.read_bytes()
+            compressed = compress(data, STATIC_LEVELS[encoding])
+            if len(compressed) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            written += 1
+            self.stdout.write(
+                f'{target.relative_to(root)}: {len(data)} -> '
+                f'{len(compressed)} байт'
+            )
+        return written, skipped
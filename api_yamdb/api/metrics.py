@@ -0,0 +1,150 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+TIME_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNRESOLVED_VIEW = 'unresolved'
+
+current = ContextVar('api_request_metrics', default=None)
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self):
+        labels = [str(bound) for bound in self.bounds] + ['+Inf']
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class ViewMetrics:
+    def __init__(self):
+        self.statuses = {}
+        self.total_ms = Histogram(TIME_BUCKETS_MS)
+        self.sql_ms = Histogram(TIME_BUCKETS_MS)
+        self.serializer_ms = Histogram(TIME_BUCKETS_MS)
+        self.queries = Histogram(QUERY_BUCKETS)
+
+    def observe(self, request_metrics, total, status_code):
+        self.statuses[status_code] = self.statuses.get(status_code, 0) + 1
+        self.total_ms.observe(total * 1000)
+        self.sql_ms.observe(request_metrics.sql_time * 1000)
+        self.serializer_ms.observe(request_metrics.serializer_time * 1000)
+        self.queries.observe(request_metrics.queries)
+
+    def as_dict(self):
+        return {
+            'requests': self.total_ms.count,
+            'statuses': {
+                str(code): count for code, count in self.statuses.items()
+            },
+            'total_ms': self.total_ms.as_dict(),
+            'sql_ms': self.sql_ms.as_dict(),
+            'serializer_ms': self.serializer_ms.as_dict(),
+            'queries': self.queries.as_dict(),
+        }
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.view = UNRESOLVED_VIEW
+        self.queries = 0
+        self.sql_time = 0
+        self.serializer_time = 0
+        self.serializing = False
+
+    def execute(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += perf_counter() - started
+            self.queries += 1
+
+    def server_timing(self, total):
+        return ', '.join((
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+            f'serializer;dur={self.serializer_time * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ))
+
+
+_lock = Lock()
+_views = {}
+
+
+def record(request_metrics, total, status_code):
+    with _lock:
+        metrics = _views.get(request_metrics.view)
+        if metrics is None:
+            metrics = _views[request_metrics.view] = ViewMetrics()
+        metrics.observe(request_metrics, total, status_code)
+
+
+def snapshot():
+    with _lock:
+        return {view: metrics.as_dict() for view, metrics in _views.items()}
+
+
+def reset():
+    with _lock:
+        _views.clear()
+
+
+def get_view_name(request, view_func):
+    cls = getattr(view_func, 'cls', None)
+    if cls is None:
+        return getattr(view_func, '__name__', UNRESOLVED_VIEW)
+    method = request.method.lower()
+    actions = getattr(view_func, 'actions', None) or {}
+    return f'{cls.__name__}.{actions.get(method, method)}'
+
+
+@contextmanager
+def serializer_timer():
+    request_metrics = current.get()
+    if request_metrics is None or request_metrics.serializing:
+        yield
+        return
+    request_metrics.serializing = True
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        request_metrics.serializer_time += perf_counter() - started
+        request_metrics.serializing = False
+
+
+class TimedSerializer:
+    def __init__(self, serializer):
+        object.__setattr__(self, 'wrapped', serializer)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.wrapped, name, value)
+
+    @property
+    def data(self):
+        with serializer_timer():
+            return self.wrapped.data
+
+    def is_valid(self, *args, **kwargs):
+        with serializer_timer():
+            return self.wrapped.is_valid(*args, **kwargs)
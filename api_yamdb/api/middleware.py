@@ -0,0 +1,90 @@
+from contextlib import ExitStack, contextmanager
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from api.compression import RESPONSE_LEVELS, get_encoders, negotiate
+from api.metrics import RequestMetrics, current, get_view_name, record
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_metrics = RequestMetrics()
+        started = perf_counter()
+        with self.measure(request_metrics):
+            response = self.get_response(request)
+        if response.streaming:
+            response.streaming_content = self.measure_stream(
+                response.streaming_content, request_metrics, started,
+                response.status_code,
+            )
+            return response
+        total = perf_counter() - started
+        response['Server-Timing'] = request_metrics.server_timing(total)
+        record(request_metrics, total, response.status_code)
+        return response
+
+    @contextmanager
+    def measure(self, request_metrics):
+        token = current.set(request_metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(request_metrics.execute)
+                    )
+                yield
+        finally:
+            current.reset(token)
+
+    def measure_stream(self, content, request_metrics, started, status_code):
+        chunks = iter(content)
+        try:
+            while True:
+                with self.measure(request_metrics):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            record(request_metrics, perf_counter() - started, status_code)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request_metrics = current.get()
+        if request_metrics is not None:
+            request_metrics.view = get_view_name(request, view_func)
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            response.streaming
+            or response.has_header('Content-Encoding')
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+        compressed = get_encoders()[encoding](
+            response.content, RESPONSE_LEVELS[encoding]
+        )
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        response['Content-Encoding'] = encoding
+        return response
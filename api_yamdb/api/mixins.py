@@ -1,3 +1,10 @@
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import (
     CreateModelMixin,
     DestroyModelMixin,
@@ -5,11 +12,233 @@ from rest_framework.mixins import (
 )
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.filters import SearchFilter
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 
+from api.cache import (
+    GLOBAL_NAMESPACE,
+    fingerprint,
+    get_cache,
+    get_last_modified,
+    is_shared_cache,
+    response_key,
+)
+from api.metrics import TimedSerializer
 from api.permissions import (IsAdminOrReadOnly,)
+from reviews.models import Review, Title
+
+
+class VersionedMixin:
+    cache_namespaces = ()
+
+    def get_cache_namespaces(self):
+        return self.cache_namespaces
+
+
+class CachedResponseMixin(VersionedMixin):
+    def cached_response(self, handler, request, *args, **kwargs):
+        if not is_shared_cache():
+            return handler(request, *args, **kwargs)
+        cache = get_cache()
+        key = response_key(request, self.get_cache_namespaces())
+        if key is None:
+            return handler(request, *args, **kwargs)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+
+class CachedRetrieveMixin(CachedResponseMixin):
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class ConditionalGetMixin(VersionedMixin):
+    def conditional_response(self, handler, request, *args, **kwargs):
+        if not is_shared_cache():
+            return handler(request, *args, **kwargs)
+        namespaces = self.get_cache_namespaces()
+        etag = fingerprint(request, namespaces)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+        etag = quote_etag(etag)
+        last_modified = get_last_modified((GLOBAL_NAMESPACE, *namespaces))
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return response
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class SerializerTimingMixin:
+    def get_serializer(self, *args, **kwargs):
+        return TimedSerializer(super().get_serializer(*args, **kwargs))
+
+
+class SparseFieldsMixin:
+    fields_query_param = 'fields'
+    sparse_columns = ()
+
+    def get_sparse_fields(self):
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = None
+            raw = self.request.query_params.get(self.fields_query_param)
+            if raw and self.request.method in SAFE_METHODS:
+                names = {name.strip() for name in raw.split(',')} - {''}
+                known = self.get_serializer_class()(
+                    context=self.get_serializer_context()
+                ).fields
+                unknown = sorted(names - set(known))
+                if unknown:
+                    raise ValidationError({
+                        self.fields_query_param: [
+                            f'Неизвестные поля: {", ".join(unknown)}.'
+                        ]
+                    })
+                self._sparse_fields = {
+                    name: known[name] for name in names
+                }
+        return self._sparse_fields
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            target = getattr(serializer, 'child', serializer)
+            for name in list(target.fields):
+                if name not in fields:
+                    target.fields.pop(name)
+        return serializer
+
+    def get_sparse_columns(self, opts, fields):
+        columns = {opts.pk.name, *self.sparse_columns}
+        columns.update(
+            field.name for field in opts.concrete_fields if field.is_relation
+        )
+        relations = set()
+        for field in fields.values():
+            if field.source == '*':
+                return None, None
+            root = field.source.split('.')[0]
+            try:
+                model_field = opts.get_field(root)
+            except FieldDoesNotExist:
+                return None, None
+            relations.add(root)
+            if model_field.concrete:
+                columns.add(root)
+        return columns, relations
+
+    def prune_queryset(self, queryset):
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        columns, relations = self.get_sparse_columns(
+            queryset.model._meta, fields
+        )
+        if columns is None:
+            return queryset
+        loaded, defer = queryset.query.deferred_loading
+        if not defer:
+            columns.update(
+                name for name in loaded
+                if name.split('__')[0] in relations
+            )
+        select_related = queryset.query.select_related
+        lookups = queryset._prefetch_related_lookups
+        queryset = queryset.only(*columns)
+        if isinstance(select_related, dict):
+            queryset = queryset.select_related(None)
+            related = [name for name in select_related if name in relations]
+            if related:
+                queryset = queryset.select_related(*related)
+        if lookups:
+            queryset = queryset.prefetch_related(None).prefetch_related(*(
+                lookup for lookup in lookups
+                if getattr(lookup, 'prefetch_through', lookup).split('__')[0]
+                in relations
+            ))
+        return queryset
+
+    def filter_queryset(self, queryset):
+        return self.prune_queryset(super().filter_queryset(queryset))
+
+
+class ValuesListMixin:
+    values_serializer_class = None
+
+    def use_values(self):
+        sparse_param = getattr(self, 'fields_query_param', None)
+        return (
+            self.action == 'list'
+            and self.values_serializer_class is not None
+            and sparse_param not in self.request.query_params
+        )
+
+    def get_serializer_class(self):
+        if self.use_values():
+            return self.values_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.use_values():
+            return queryset.prefetch_related(None).values(
+                *self.values_serializer_class.values
+            )
+        return queryset
+
+
+class ParentObjectsMixin:
+    def get_title(self):
+        if not hasattr(self, '_title'):
+            if 'review_id' in self.kwargs:
+                self._title = self.get_review().title
+            else:
+                self._title = get_object_or_404(
+                    Title, pk=self.kwargs.get('title_id')
+                )
+        return self._title
+
+    def get_review(self):
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review.objects.select_related('title'),
+                pk=self.kwargs.get('review_id'),
+                title_id=self.kwargs.get('title_id'),
+            )
+        return self._review
 
 
 class ModelMixinSet(
+    SerializerTimingMixin,
+    SparseFieldsMixin,
+    CachedResponseMixin,
     CreateModelMixin, ListModelMixin, DestroyModelMixin, GenericViewSet
 ):
     filter_backends = (SearchFilter,)
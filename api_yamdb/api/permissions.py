@@ -1,61 +1,95 @@
+from collections import namedtuple
+from functools import lru_cache
+
 from rest_framework import permissions
 
+AUTHENTICATED = 'authenticated'
+MODERATOR = 'moderator'
+ADMIN = 'admin'
+STAFF = frozenset((MODERATOR, ADMIN))
+
+Access = namedtuple('Access', ('safe', 'capabilities', 'user_id'))
+
+
+@lru_cache(maxsize=None)
+def compile_capabilities(role, is_superuser):
+    capabilities = {AUTHENTICATED}
+    if role == MODERATOR:
+        capabilities.add(MODERATOR)
+    if role == ADMIN or is_superuser:
+        capabilities.add(ADMIN)
+    return frozenset(capabilities)
+
+
+def get_access(request):
+    access = getattr(request, '_access', None)
+    if access is None:
+        user = request.user
+        if user.is_authenticated:
+            capabilities = compile_capabilities(
+                getattr(user, 'role', None), bool(user.is_superuser)
+            )
+        else:
+            capabilities = frozenset()
+        access = Access(
+            request.method in permissions.SAFE_METHODS,
+            capabilities,
+            user.pk,
+        )
+        request._access = access
+    return access
+
+
+def get_capabilities(request):
+    return get_access(request).capabilities
+
 
 class IsModerator(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.is_moderator
+        return MODERATOR in get_capabilities(request)
 
     def has_object_permission(self, request, view, obj):
-        return request.user.is_authenticated and request.user.is_moderator
+        return MODERATOR in get_capabilities(request)
 
 
 class IsAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
-        return (
-            request.user.is_authenticated
-            and request.user.is_admin
-            or request.user.is_superuser
-        )
+        return ADMIN in get_capabilities(request)
 
     def has_object_permission(self, request, view, obj):
-        return (
-            request.user.is_authenticated
-            and request.user.is_admin
-            or request.user.is_superuser
-        )
+        return ADMIN in get_capabilities(request)
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        if request.user.is_anonymous:
-            return False
-        return (
-            request.user.is_authenticated
-            and request.user.is_superuser
-            or request.user.is_admin
-        )
+        access = get_access(request)
+        return access.safe or ADMIN in access.capabilities
 
     def has_object_permission(self, request, view, obj):
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        if request.user.is_anonymous:
-            return False
-        return (
-            request.user.is_authenticated
-            and request.user.is_superuser
-            or request.user.is_admin
-        )
+        return self.has_permission(request, view)
 
 
 class IsAuthor(permissions.BasePermission):
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        return request.user.is_authenticated
+        access = get_access(request)
+        return access.safe or AUTHENTICATED in access.capabilities
 
     def has_object_permission(self, request, view, obj):
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        return request.user.is_authenticated and request.user == obj.author
+        access = get_access(request)
+        return access.safe or (
+            AUTHENTICATED in access.capabilities
+            and obj.author_id == access.user_id
+        )
+
+
+class IsAuthorOrStaff(IsAuthor):
+    def has_object_permission(self, request, view, obj):
+        access = get_access(request)
+        return (
+            access.safe
+            or not access.capabilities.isdisjoint(STAFF)
+            or (
+                AUTHENTICATED in access.capabilities
+                and obj.author_id == access.user_id
+            )
+        )
@@ -1,6 +1,7 @@
+from collections import defaultdict
 from datetime import datetime
 from django.contrib.auth import get_user_model
-from django.shortcuts import get_object_or_404
+from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.relations import SlugRelatedField
 
@@ -13,13 +14,16 @@ User = get_user_model()
 
 class ValidateMixin:
     def validate(self, data):
-        if User.objects.filter(
-            username=data.get('username'), email=data.get('email')
-        ).exists():
+        username, email = data.get('username'), data.get('email')
+        matches = list(
+            User.objects.filter(Q(username=username) | Q(email=email))
+            .values_list('username', 'email')[:2]
+        )
+        if (username, email) in matches:
             return data
-        elif User.objects.filter(username=data.get('username')).exists():
+        if any(match[0] == username for match in matches):
             raise serializers.ValidationError('Это имя уже занято')
-        elif User.objects.filter(email=data.get('email')).exists():
+        if any(match[1] == email for match in matches):
             raise serializers.ValidationError('Эта почта уже занята')
         return data
 
@@ -63,6 +67,10 @@ class TokenSerializer(serializers.Serializer):
     confirmation_code = serializers.CharField(required=True)
 
 
+class TokenRefreshSerializer(serializers.Serializer):
+    refresh = serializers.CharField()
+
+
 class UserAdminEditSerializer(ValidateMixin, serializers.ModelSerializer):
     first_name = serializers.CharField(max_length=150, required=False)
     last_name = serializers.CharField(max_length=150, required=False)
@@ -111,7 +119,15 @@ class TitleSerializer(serializers.ModelSerializer):
     rating = serializers.FloatField(read_only=True)
 
     class Meta:
-        fields = '__all__'
+        fields = (
+            'id',
+            'name',
+            'year',
+            'rating',
+            'description',
+            'genre',
+            'category',
+        )
         model = Title
 
     def to_representation(self, instance):
@@ -119,11 +135,12 @@ class TitleSerializer(serializers.ModelSerializer):
             instance
         )
 
-        representation['genre'] = GenreSerializer(
-            instance.genre.all(), many=True
-        ).data
+        if 'genre' in representation:
+            representation['genre'] = GenreSerializer(
+                instance.genre.all(), many=True
+            ).data
 
-        if instance.category:
+        if 'category' in representation and instance.category:
             representation['category'] = CategorySerializer(
                 instance.category
             ).data
@@ -131,7 +148,80 @@ class TitleSerializer(serializers.ModelSerializer):
         return representation
 
     def validate_year(self, value):
-        print(datetime.now().year)
+        if value > datetime.now().year:
+            raise serializers.ValidationError('произведение еще не вышло')
+        return value
+
+
+class TitleValuesListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        rows = list(data)
+        genres = defaultdict(list)
+        for title_id, name, slug in Genre.objects.filter(
+            genre__title_id__in=[row['id'] for row in rows]
+        ).values_list('genre__title_id', 'name', 'slug'):
+            genres[title_id].append({'name': name, 'slug': slug})
+        for row in rows:
+            row['genre'] = genres[row['id']]
+        return super().to_representation(rows)
+
+
+class TitleValuesSerializer(serializers.BaseSerializer):
+    values = (
+        'id',
+        'name',
+        'year',
+        'rating',
+        'description',
+        'category__name',
+        'category__slug',
+    )
+
+    class Meta:
+        list_serializer_class = TitleValuesListSerializer
+
+    def to_representation(self, row):
+        category = None
+        if row['category__slug'] is not None:
+            category = {
+                'name': row['category__name'],
+                'slug': row['category__slug'],
+            }
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'year': row['year'],
+            'rating': row['rating'],
+            'description': row['description'],
+            'genre': row.get('genre', []),
+            'category': category,
+        }
+
+
+class LeaderboardSerializer(TitleSerializer):
+    weighted_rating = serializers.FloatField(
+        source='ranking.weighted_rating', read_only=True
+    )
+    recent_reviews = serializers.IntegerField(
+        source='ranking.recent_reviews', read_only=True
+    )
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + (
+            'weighted_rating',
+            'recent_reviews',
+        )
+
+
+class TitleBulkItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(required=False)
+    name = serializers.CharField(max_length=256)
+    year = serializers.IntegerField()
+    description = serializers.CharField(required=False, allow_blank=True)
+    genre = serializers.ListField(child=serializers.SlugField())
+    category = serializers.SlugField()
+
+    def validate_year(self, value):
         if value > datetime.now().year:
             raise serializers.ValidationError('произведение еще не вышло')
         return value
@@ -147,26 +237,38 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ('id', 'text', 'author', 'score', 'pub_date')
         model = Review
 
-    def validate(self, data):
-        if self.instance is None:
-            title_id = self.context['view'].kwargs.get('title_id')
-            reviews = get_object_or_404(Title, pk=title_id).reviews.all()
-            if reviews.filter(
-                author_id=self.context['request'].user.id
-            ).exists():
-                raise serializers.ValidationError(
-                    'Вы уже оставляли отзыв на это произведение.'
-                )
-        return data
+
+format_datetime = serializers.DateTimeField().to_representation
+
+
+class ReviewValuesSerializer(serializers.BaseSerializer):
+    values = ('id', 'text', 'author__username', 'score', 'pub_date')
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'text': row['text'],
+            'author': row['author__username'],
+            'score': row['score'],
+            'pub_date': format_datetime(row['pub_date']),
+        }
 
 
 class CommentSerializer(serializers.ModelSerializer):
     author = SlugRelatedField(
         read_only=True,
         slug_field='username',
-        default=serializers.CurrentUserDefault(),
     )
 
     class Meta:
         fields = ('id', 'text', 'author', 'pub_date')
         model = Comment
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    id = serializers.IntegerField()
+    title_id = serializers.IntegerField()
+    review_id = serializers.IntegerField(allow_null=True)
+    snippet = serializers.CharField()
+    rank = serializers.FloatField()
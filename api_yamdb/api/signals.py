@@ -0,0 +1,73 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import GLOBAL_NAMESPACE, bump
+from reviews.models import Category, Comment, Genre, Genre_Title, Review, Title
+from reviews.signals import catalog_changed
+
+User = get_user_model()
+
+
+def bump_on_commit(*namespaces):
+    transaction.on_commit(partial(bump, *namespaces))
+
+
+@receiver((post_save, post_delete), sender=Genre)
+def genre_changed(sender, **kwargs):
+    bump_on_commit('genres')
+
+
+@receiver((post_save, post_delete), sender=Category)
+def category_changed(sender, **kwargs):
+    bump_on_commit('categories')
+
+
+@receiver((post_save, post_delete), sender=Title)
+def title_changed(sender, instance, **kwargs):
+    bump_on_commit('titles', f'title:{instance.pk}', f'reviews:{instance.pk}')
+
+
+@receiver((post_save, post_delete), sender=Genre_Title)
+def genre_title_changed(sender, instance, **kwargs):
+    bump_on_commit('titles', f'title:{instance.title_id_id}')
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def title_genres_changed(sender, instance, action, reverse, pk_set,
+                         **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_on_commit('titles', f'title:{instance.pk}')
+    elif pk_set:
+        bump_on_commit('titles', *(f'title:{pk}' for pk in pk_set))
+    else:
+        bump_on_commit(GLOBAL_NAMESPACE)
+
+
+@receiver(catalog_changed)
+def titles_changed(sender, title_ids, **kwargs):
+    if title_ids is None:
+        bump_on_commit(GLOBAL_NAMESPACE)
+    else:
+        bump_on_commit('titles', *(f'title:{pk}' for pk in title_ids))
+
+
+@receiver((post_save, post_delete), sender=Review)
+def review_changed(sender, instance, **kwargs):
+    bump_on_commit(f'reviews:{instance.title_id}', f'comments:{instance.pk}')
+
+
+@receiver((post_save, post_delete), sender=Comment)
+def comment_changed(sender, instance, **kwargs):
+    bump_on_commit(f'comments:{instance.review_id_id}')
+
+
+@receiver((post_save, post_delete), sender=User)
+def user_changed(sender, instance, created=False, **kwargs):
+    if not created:
+        bump_on_commit('users')
@@ -7,10 +7,14 @@ from api.views import (
     GenreViewSet,
     CategoryViewSet,
     CreateJWTTokenView,
+    RefreshJWTTokenView,
     SignUpView,
     ReviewViewSet,
     UserViewSet,
     CommentViewSet,
+    SearchView,
+    ExportView,
+    MetricsView,
 )
 
 
@@ -32,4 +36,8 @@ urlpatterns = [
     path('v1/', include(router.urls)),
     path('v1/auth/signup/', SignUpView.as_view()),
     path('v1/auth/token/', CreateJWTTokenView.as_view()),
+    path('v1/auth/token/refresh/', RefreshJWTTokenView.as_view()),
+    path('v1/search/', SearchView.as_view()),
+    path('v1/metrics/', MetricsView.as_view()),
+    path('v1/export/<slug:dataset>.<slug:fmt>', ExportView.as_view()),
 ]
@@ -1,25 +1,47 @@
+from functools import partial
+
 from rest_framework import generics, status, permissions, viewsets, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import JSONParser
 from rest_framework.pagination import (
     PageNumberPagination,
     LimitOffsetPagination,
 )
-from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Avg
 
-from .filters import TitleFilter
-from reviews.models import Title, Genre, Category, Review
-from .mixins import ModelMixinSet
+from .bulk import save_titles
+from .metrics import TimedSerializer, snapshot
+from .filters import LeaderboardFilter, TitleFilter
+from .pagination import OptionalCursorPagination
+from .parsers import NDJSONParser
+from reviews.export import DATASETS, FORMATS, export_rows, get_filename
+from reviews.models import Title, Genre, Category
+from reviews.ratings import get_title_stats
+from reviews.search import SearchResults
+from .mixins import (
+    CachedRetrieveMixin,
+    ConditionalGetMixin,
+    ModelMixinSet,
+    ParentObjectsMixin,
+    SerializerTimingMixin,
+    SparseFieldsMixin,
+    ValuesListMixin,
+)
 from api.permissions import (
     IsAdminOrReadOnly,
     IsAdmin,
-    IsModerator,
-    IsAuthor,
+    IsAuthorOrStaff,
 )
 from .serializers import (
     CommentSerializer,
@@ -28,11 +50,21 @@ from .serializers import (
     GenreSerializer,
     UserSerializer,
     TokenSerializer,
+    TokenRefreshSerializer,
     ReviewSerializer,
     UserAdminEditSerializer,
     SignUpSerializer,
+    SearchResultSerializer,
+    LeaderboardSerializer,
+    ReviewValuesSerializer,
+    TitleValuesSerializer,
+)
+from users.outbox import enqueue_email
+from users.tokens import (
+    UserAccessToken,
+    UserRefreshToken,
+    refresh_access_token,
 )
-from django.core.mail import send_mail
 
 
 EMAIL = 'yandexyamdb@yandex.ru'
@@ -41,7 +73,7 @@ EMAIL = 'yandexyamdb@yandex.ru'
 User = get_user_model()
 
 
-class SignUpView(generics.CreateAPIView):
+class SignUpView(SerializerTimingMixin, generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = SignUpSerializer
     permission_classes = (permissions.AllowAny,)
@@ -51,17 +83,16 @@ class SignUpView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user, _ = User.objects.get_or_create(**serializer.validated_data)
         token = default_token_generator.make_token(user)
-        send_mail(
+        enqueue_email(
+            recipient=user.email,
             subject='Подтвердите регистрацию',
-            message=f'Ваш код: {token}',
+            body=f'Ваш код: {token}',
             from_email=EMAIL,
-            recipient_list=[user.email],
-            fail_silently=True,
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class CreateJWTTokenView(generics.CreateAPIView):
+class CreateJWTTokenView(SerializerTimingMixin, generics.CreateAPIView):
     serializer_class = TokenSerializer
     permission_classes = (permissions.AllowAny,)
 
@@ -76,12 +107,39 @@ class CreateJWTTokenView(generics.CreateAPIView):
         )
         token = serializer.validated_data['confirmation_code']
         if default_token_generator.check_token(user, token):
-            token = AccessToken.for_user(user)
-            return Response({'token': str(token)}, status=status.HTTP_200_OK)
+            return Response(
+                {
+                    'token': str(UserAccessToken.for_user(user)),
+                    'refresh': str(UserRefreshToken.for_user(user)),
+                },
+                status=status.HTTP_200_OK,
+            )
         return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class RefreshJWTTokenView(
+    SerializerTimingMixin, generics.GenericAPIView
+):
+    serializer_class = TokenRefreshSerializer
+    permission_classes = (permissions.AllowAny,)
+    authentication_classes = ()
+
+    def get_authenticate_header(self, request):
+        return 'Bearer realm="api"'
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            token = refresh_access_token(serializer.validated_data['refresh'])
+        except TokenError as error:
+            raise InvalidToken(error.args[0])
+        return Response({'token': str(token)})
+
+
+class UserViewSet(
+    SerializerTimingMixin, SparseFieldsMixin, viewsets.ModelViewSet
+):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = (
@@ -101,30 +159,41 @@ class UserViewSet(viewsets.ModelViewSet):
         url_path='me',
     )
     def get_user_info(self, request):
-        serializer = UserSerializer(request.user)
+        user = get_object_or_404(User, pk=request.user.pk)
+        serializer = TimedSerializer(UserSerializer(user))
         if request.method == 'PATCH':
             if 'role' in request.data:
                 return Response(
                     {'detail': 'Вы не можете изменять роль.'},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            if request.user.is_admin:
-                serializer = UserSerializer(
-                    request.user, data=request.data, partial=True
-                )
+            if user.is_admin:
+                serializer = TimedSerializer(UserSerializer(
+                    user, data=request.data, partial=True
+                ))
             else:
-                serializer = UserAdminEditSerializer(
-                    request.user, data=request.data, partial=True
-                )
+                serializer = TimedSerializer(UserAdminEditSerializer(
+                    user, data=request.data, partial=True
+                ))
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.data)
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score'))
+class TitleViewSet(
+    SerializerTimingMixin,
+    ValuesListMixin,
+    SparseFieldsMixin,
+    ConditionalGetMixin,
+    CachedRetrieveMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre'
+    )
     serializer_class = TitleSerializer
+    values_serializer_class = TitleValuesSerializer
     pagination_class = LimitOffsetPagination
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitleFilter
@@ -136,41 +205,157 @@ class TitleViewSet(viewsets.ModelViewSet):
         'delete',
     ]
 
-    def get_queryset(self):
-        return Title.objects.annotate(rating=Avg('reviews__score'))
+    def get_cache_namespaces(self):
+        if self.action == 'stats':
+            return (f'title:{self.kwargs["pk"]}',)
+        if self.action == 'retrieve':
+            return (f'title:{self.kwargs["pk"]}', 'genres', 'categories')
+        return ('titles', 'genres', 'categories')
+
+    def get_stats(self, request, pk=None):
+        title = get_object_or_404(
+            Title.objects.only('rating', 'rating_count'), pk=pk
+        )
+        return Response(get_title_stats(title))
+
+    def get_serializer_class(self):
+        if self.action in ('top', 'trending'):
+            return LeaderboardSerializer
+        return super().get_serializer_class()
+
+    def get_leaderboard(self, request, ordering):
+        queryset = LeaderboardFilter(
+            request.query_params,
+            queryset=Title.objects.select_related(
+                'category', 'ranking'
+            ).prefetch_related('genre').order_by(*ordering),
+        ).qs
+        page = self.paginate_queryset(self.prune_queryset(queryset))
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_top(self, request):
+        return self.get_leaderboard(
+            request, ('-ranking__weighted_rating', 'pk')
+        )
+
+    def get_trending(self, request):
+        return self.get_leaderboard(
+            request,
+            ('-ranking__recent_reviews', '-ranking__weighted_rating', 'pk'),
+        )
+
+    @action(detail=False, methods=['get'])
+    def top(self, request):
+        return self.conditional_response(
+            partial(self.cached_response, self.get_top), request
+        )
+
+    @action(detail=False, methods=['get'])
+    def trending(self, request):
+        return self.conditional_response(
+            partial(self.cached_response, self.get_trending), request
+        )
+
+    @action(
+        detail=False,
+        methods=['post'],
+        parser_classes=(JSONParser, NDJSONParser),
+    )
+    def bulk(self, request):
+        if not isinstance(request.data, list) or not request.data:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Ожидается непустой список произведений.'
+                ]
+            })
+        if len(request.data) > settings.TITLES_BULK_LIMIT:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'За один запрос можно передать не больше '
+                    f'{settings.TITLES_BULK_LIMIT} произведений.'
+                ]
+            })
+        titles, errors = save_titles(request.data)
+        if titles is None:
+            return Response(
+                {'errors': errors}, status=status.HTTP_400_BAD_REQUEST
+            )
+        saved = self.get_queryset().in_bulk([title.pk for title in titles])
+        serializer = self.get_serializer(
+            [saved[title.pk] for title in titles], many=True
+        )
+        if all('id' in item for item in request.data):
+            return Response(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'])
+    def stats(self, request, pk=None):
+        return self.conditional_response(
+            partial(self.cached_response, self.get_stats), request, pk=pk
+        )
 
 
 class GenreViewSet(ModelMixinSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    cache_namespaces = ('genres',)
 
 
 class CategoryViewSet(ModelMixinSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_namespaces = ('categories',)
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    SerializerTimingMixin,
+    ValuesListMixin,
+    SparseFieldsMixin,
+    ParentObjectsMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = ReviewSerializer
+    values_serializer_class = ReviewValuesSerializer
     http_method_names = [
         'get',
         'post',
         'patch',
         'delete',
     ]
-    permission_classes = (IsAuthor | IsModerator | IsAdmin,)
+    permission_classes = (IsAuthorOrStaff,)
+    pagination_class = OptionalCursorPagination
+    sparse_columns = ('pub_date',)
 
-    def get_title(self):
-        return get_object_or_404(Title, pk=self.kwargs.get('title_id'))
+    def get_cache_namespaces(self):
+        return (f'reviews:{self.kwargs["title_id"]}', 'users')
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        return self.get_title().reviews.select_related('author').only(
+            'id', 'title', 'author__username', 'text', 'score', 'pub_date'
+        )
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, title=self.get_title())
-
-
-class CommentViewSet(viewsets.ModelViewSet):
+        title = self.get_title()
+        try:
+            with transaction.atomic():
+                serializer.save(author_id=self.request.user.pk, title=title)
+        except IntegrityError:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Вы уже оставляли отзыв на это произведение.'
+                ]
+            })
+
+
+class CommentViewSet(
+    SerializerTimingMixin,
+    SparseFieldsMixin,
+    ParentObjectsMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = CommentSerializer
     http_method_names = [
         'get',
@@ -178,13 +363,54 @@ class CommentViewSet(viewsets.ModelViewSet):
         'patch',
         'delete',
     ]
-    permission_classes = (IsAuthor | IsModerator | IsAdmin,)
+    permission_classes = (IsAuthorOrStaff,)
+    pagination_class = OptionalCursorPagination
+    sparse_columns = ('pub_date',)
 
-    def get_review(self):
-        return get_object_or_404(Review, pk=self.kwargs.get('review_id'))
+    def get_cache_namespaces(self):
+        return (f'comments:{self.kwargs["review_id"]}', 'users')
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        return self.get_review().comments.select_related('author').only(
+            'id', 'review_id', 'author__username', 'text', 'pub_date'
+        )
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, review_id=self.get_review())
+        serializer.save(
+            author_id=self.request.user.pk, review_id=self.get_review()
+        )
+
+
+class SearchView(SerializerTimingMixin, generics.ListAPIView):
+    serializer_class = SearchResultSerializer
+    permission_classes = (permissions.AllowAny,)
+
+    def get_queryset(self):
+        types = self.request.query_params.get('type')
+        return SearchResults(
+            self.request.query_params.get('q', ''),
+            types.split(',') if types else None,
+        )
+
+
+class ExportView(APIView):
+    permission_classes = (IsAdmin,)
+
+    def get(self, request, dataset, fmt):
+        if dataset not in DATASETS or fmt not in FORMATS:
+            raise NotFound('Такой выгрузки нет.')
+        response = StreamingHttpResponse(
+            export_rows(dataset, fmt, settings.EXPORT_CHUNK_SIZE),
+            content_type=FORMATS[fmt],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{get_filename(dataset, fmt)}"'
+        )
+        return response
+
+
+class MetricsView(APIView):
+    permission_classes = (IsAdmin,)
+
+    def get(self, request):
+        return Response(snapshot())
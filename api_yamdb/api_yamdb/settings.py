@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from datetime import timedelta
@@ -28,6 +29,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.MetricsMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -69,6 +72,46 @@ DATABASES = {
 }
 
 
+# Cache
+
+CACHE_BACKEND = os.getenv(
+    'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+)
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    },
+    'files': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+    },
+}
+
+if CACHE_BACKEND == 'django.core.cache.backends.memcached.PyMemcacheCache':
+    CACHES['default']['OPTIONS'] = {
+        'ignore_exc': True,
+        'connect_timeout': 0.5,
+        'timeout': 0.5,
+    }
+
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 60 * 5
+API_CACHE_SINGLE_PROCESS = os.getenv('API_CACHE_SINGLE_PROCESS') == '1'
+
+RANKING_MIN_REVIEWS = 3
+RANKING_PRIOR_SCORE = 5.5
+RANKING_TRENDING_DAYS = 7
+
+TITLES_BULK_LIMIT = 1000
+
+EXPORT_CHUNK_SIZE = 2000
+
+AUTH_VERSION_CACHE_ALIAS = 'default'
+AUTH_VERSION_CACHE_TIMEOUT = 60
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -112,7 +155,11 @@ REST_FRAMEWORK = {
     ],
 
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.ClaimsJWTAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 5,
@@ -121,9 +168,14 @@ REST_FRAMEWORK = {
 AUTH_USER_MODEL = 'users.User'
 
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(days=5),
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=5),
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+JWT_VERIFIED_CACHE_SIZE = 1024
+
+COMPRESSION_MIN_SIZE = 1024
+
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
@@ -0,0 +1,8 @@
+from .settings import *  # noqa: F401,F403
+from .settings import CACHES
+
+CACHES['default'] = {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+}
+
+API_CACHE_SINGLE_PROCESS = True
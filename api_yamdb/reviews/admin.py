@@ -6,7 +6,7 @@ from .models import Category, Comment, Genre, Review, Title
 
 @admin.register(Title)
 class TitleAdmin(admin.ModelAdmin):
-    pass
+    readonly_fields = ('rating_sum', 'rating_count', 'rating')
 
 
 @admin.register(Genre)
@@ -0,0 +1,102 @@
+import csv
+import json
+from datetime import datetime, timezone
+from itertools import islice
+
+from .models import Category, Comment, Genre, Genre_Title, Review, Title
+
+DEFAULT_CHUNK_SIZE = 2000
+
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+DATASETS = {
+    'categories': (
+        'category', Category, (('id', 'id'), ('name', 'name'),
+                               ('slug', 'slug')),
+    ),
+    'genres': (
+        'genre', Genre, (('id', 'id'), ('name', 'name'), ('slug', 'slug')),
+    ),
+    'titles': (
+        'titles', Title, (
+            ('id', 'id'),
+            ('name', 'name'),
+            ('year', 'year'),
+            ('category', 'category_id'),
+            ('description', 'description'),
+        ),
+    ),
+    'genre_titles': (
+        'genre_title', Genre_Title, (
+            ('id', 'id'),
+            ('title_id', 'title_id_id'),
+            ('genre_id', 'genre_id_id'),
+        ),
+    ),
+    'reviews': (
+        'review', Review, (
+            ('id', 'id'),
+            ('title_id', 'title_id'),
+            ('text', 'text'),
+            ('author', 'author_id'),
+            ('score', 'score'),
+            ('pub_date', 'pub_date'),
+        ),
+    ),
+    'comments': (
+        'comments', Comment, (
+            ('id', 'id'),
+            ('review_id', 'review_id_id'),
+            ('text', 'text'),
+            ('author', 'author_id'),
+            ('pub_date', 'pub_date'),
+        ),
+    ),
+}
+
+
+class Line:
+    def write(self, value):
+        return value
+
+
+def format_value(value):
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).isoformat(
+            timespec='milliseconds'
+        ).replace('+00:00', 'Z')
+    return value
+
+
+def get_filename(dataset, fmt):
+    return f'{DATASETS[dataset][0]}.{fmt}'
+
+
+def export_rows(dataset, fmt, chunk_size=DEFAULT_CHUNK_SIZE):
+    _, model, columns = DATASETS[dataset]
+    headers = [header for header, _ in columns]
+    rows = (
+        model.objects.order_by('pk')
+        .values_list(*(field for _, field in columns))
+        .iterator(chunk_size=chunk_size)
+    )
+    if fmt == 'csv':
+        writer = csv.writer(Line(), lineterminator='\n')
+        yield writer.writerow(headers)
+        encode = writer.writerow
+    else:
+        def encode(row):
+            return json.dumps(
+                dict(zip(headers, row)), ensure_ascii=False
+            ) + '\n'
+    while True:
+        chunk = [
+            encode([format_value(value) for value in row])
+            for row in islice(rows, chunk_size)
+        ]
+        if not chunk:
+            break
+        yield ''.join(chunk)
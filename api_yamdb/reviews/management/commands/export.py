@@ -0,0 +1,60 @@
+from pathlib import Path
+from time import monotonic
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.export import (
+    DATASETS,
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    export_rows,
+    get_filename,
+)
+
+
+class Command(BaseCommand):
+    help = 'Выгружает произведения, отзывы и комментарии в CSV или NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='.',
+            help='Каталог, в который будут записаны файлы.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=tuple(FORMATS),
+            default='csv',
+            help='Формат файлов.',
+        )
+        parser.add_argument(
+            '--dataset',
+            action='append',
+            choices=tuple(DATASETS),
+            help='Набор данных для выгрузки; по умолчанию выгружаются все.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Количество строк, читаемых из базы за один раз.',
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('Размер пачки должен быть положительным.')
+        path = Path(options['path'])
+        path.mkdir(parents=True, exist_ok=True)
+        for dataset in options['dataset'] or DATASETS:
+            filename = get_filename(dataset, options['format'])
+            started = monotonic()
+            with open(path / filename, 'w', encoding='utf-8',
+                      newline='') as file:
+                for chunk in export_rows(
+                    dataset, options['format'], options['chunk_size']
+                ):
+                    file.write(chunk)
+            self.stdout.write(
+                f'{filename}: {monotonic() - started:.2f} с'
+            )
+        self.stdout.write(self.style.SUCCESS('Выгрузка завершена.'))
@@ -0,0 +1,166 @@
+import csv
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from time import monotonic
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    Genre_Title,
+    Review,
+    Title,
+    normalize_name,
+)
+from reviews.rankings import refresh_rankings
+from reviews.ratings import rebuild_ratings
+from reviews.signals import catalog_changed
+
+
+User = get_user_model()
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def user_from_row(row):
+    return User(
+        id=row['id'],
+        username=row['username'],
+        email=row['email'],
+        role=row['role'],
+        bio=row['bio'],
+        first_name=row['first_name'],
+        last_name=row['last_name'],
+        password=make_password(None),
+    )
+
+
+def title_from_row(row):
+    return Title(
+        id=row['id'],
+        name=row['name'],
+        name_normalized=normalize_name(row['name']),
+        year=row['year'],
+        category_id=row['category'] or None,
+        description=row.get('description', ''),
+    )
+
+
+def genre_title_from_row(row):
+    return Genre_Title(
+        id=row['id'],
+        title_id_id=row['title_id'],
+        genre_id_id=row['genre_id'],
+    )
+
+
+def review_from_row(row):
+    return Review(
+        id=row['id'],
+        title_id=row['title_id'],
+        text=row['text'],
+        author_id=row['author'],
+        score=row['score'],
+        pub_date=row['pub_date'],
+    )
+
+
+def comment_from_row(row):
+    return Comment(
+        id=row['id'],
+        review_id_id=row['review_id'],
+        text=row['text'],
+        author_id=row['author'],
+        pub_date=row['pub_date'],
+    )
+
+
+IMPORT_ORDER = (
+    ('users.csv', User, user_from_row),
+    ('category.csv', Category, lambda row: Category(**row)),
+    ('genre.csv', Genre, lambda row: Genre(**row)),
+    ('titles.csv', Title, title_from_row),
+    ('genre_title.csv', Genre_Title, genre_title_from_row),
+    ('review.csv', Review, review_from_row),
+    ('comments.csv', Comment, comment_from_row),
+)
+
+
+@contextmanager
+def explicit_pub_date(*models):
+    fields = [model._meta.get_field('pub_date') for model in models]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = 'Загружает данные из CSV-файлов static/data в базу данных.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=settings.BASE_DIR / 'static' / 'data',
+            help='Каталог с CSV-файлами.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Количество строк в одном INSERT.',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('Размер пачки должен быть положительным.')
+        with explicit_pub_date(Review, Comment):
+            for filename, model, make_object in IMPORT_ORDER:
+                self.import_file(
+                    Path(options['path']), filename, model, make_object,
+                    options['batch_size'],
+                )
+        self.reset_sequences()
+        rebuild_ratings()
+        refresh_rankings()
+        catalog_changed.send(sender=Title, title_ids=None)
+        self.stdout.write(self.style.SUCCESS('Загрузка завершена.'))
+
+    def import_file(self, path, filename, model, make_object, batch_size):
+        started = monotonic()
+        total = 0
+        try:
+            with open(path / filename, encoding='utf-8', newline='') as file:
+                objects = map(make_object, csv.DictReader(file))
+                with transaction.atomic():
+                    while True:
+                        batch = list(islice(objects, batch_size))
+                        if not batch:
+                            break
+                        model.objects.bulk_create(batch)
+                        total += len(batch)
+        except FileNotFoundError:
+            raise CommandError(f'Файл {path / filename} не найден.')
+        elapsed = monotonic() - started
+        self.stdout.write(
+            f'{filename}: {total} строк за {elapsed:.2f} с '
+            f'({total / elapsed if elapsed else total:.0f} строк/с)'
+        )
+
+    def reset_sequences(self):
+        models = [model for _, model, _ in IMPORT_ORDER]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
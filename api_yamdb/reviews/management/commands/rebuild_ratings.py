@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.models import Title
+from reviews.rankings import refresh_rankings
+from reviews.ratings import (
+    find_rating_mismatches,
+    find_score_mismatches,
+    rebuild_ratings,
+)
+from reviews.signals import catalog_changed
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённые рейтинги произведений по отзывам.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Только сверить рейтинги, ничего не изменяя.',
+        )
+
+    def handle(self, *args, **options):
+        if not options['check']:
+            updated = rebuild_ratings()
+            refresh_rankings()
+            catalog_changed.send(sender=Title, title_ids=None)
+            self.stdout.write(
+                self.style.SUCCESS(f'Пересчитано произведений: {updated}')
+            )
+            return
+        mismatches = 0
+        for pk, stored, actual in find_rating_mismatches():
+            mismatches += 1
+            self.stderr.write(
+                f'Произведение {pk}: сохранено {stored}, ожидается {actual}'
+            )
+        for pk, stored, actual in find_score_mismatches():
+            mismatches += 1
+            self.stderr.write(
+                f'Распределение оценок произведения {pk}: '
+                f'сохранено {stored}, ожидается {actual}'
+            )
+        if mismatches:
+            raise CommandError(
+                f'Найдено расхождений в рейтингах: {mismatches}.'
+            )
+        self.stdout.write(self.style.SUCCESS('Рейтинги согласованы.'))
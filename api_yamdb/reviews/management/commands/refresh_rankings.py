@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from reviews.models import Title
+from reviews.rankings import refresh_rankings
+from reviews.signals import catalog_changed
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчитывает таблицу рейтинга произведений, '
+        'в том числе число недавних отзывов.'
+    )
+
+    def handle(self, *args, **options):
+        updated = refresh_rankings()
+        catalog_changed.send(sender=Title, title_ids=None)
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлено позиций в рейтинге: {updated}')
+        )
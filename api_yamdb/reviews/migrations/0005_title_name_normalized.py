@@ -0,0 +1,35 @@
+# Generated by Django 3.2 on 2026-10-18 18:24
+
+from django.db import migrations, models
+
+
+def fill_name_normalized(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    batch = []
+    for title in Title.objects.only('pk', 'name').iterator(chunk_size=1000):
+        title.name_normalized = ' '.join(title.name.lower().split())
+        batch.append(title)
+        if len(batch) == 1000:
+            Title.objects.bulk_update(batch, ['name_normalized'])
+            batch = []
+    Title.objects.bulk_update(batch, ['name_normalized'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_review_comment_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='name_normalized',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=256, verbose_name='Название для поиска'),
+        ),
+        migrations.RunPython(fill_name_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['category', 'year'], name='title_category_year_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 3.2 on 2026-10-18 18:32
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def fill_rankings(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    Title = apps.get_model('reviews', 'Title')
+    TitleRanking = apps.get_model('reviews', 'TitleRanking')
+    since = timezone.now() - timedelta(days=settings.RANKING_TRENDING_DAYS)
+    recent = dict(
+        Review.objects.filter(pub_date__gte=since)
+        .order_by()
+        .values_list('title')
+        .annotate(count=Count('pk'))
+    )
+    min_reviews = settings.RANKING_MIN_REVIEWS
+    prior = min_reviews * settings.RANKING_PRIOR_SCORE
+    titles = Title.objects.values_list(
+        'pk', 'category', 'rating_sum', 'rating_count'
+    )
+    TitleRanking.objects.bulk_create(
+        (
+            TitleRanking(
+                title_id=pk,
+                category_id=category_id,
+                weighted_rating=(rating_sum + prior) / (
+                    rating_count + min_reviews
+                ),
+                recent_reviews=recent.get(pk, 0),
+            )
+            for pk, category_id, rating_sum, rating_count
+            in titles.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_titlescore'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TitleRanking',
+            fields=[
+                ('title', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ranking', serialize=False, to='reviews.title', verbose_name='Произведение')),
+                ('weighted_rating', models.FloatField(default=0, verbose_name='Взвешенный рейтинг')),
+                ('recent_reviews', models.PositiveIntegerField(default=0, verbose_name='Отзывов за последние дни')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='reviews.category', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'позиция в рейтинге',
+                'verbose_name_plural': 'Позиции в рейтинге',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='titleranking',
+            index=models.Index(fields=['-weighted_rating', 'title'], name='ranking_weighted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titleranking',
+            index=models.Index(fields=['-recent_reviews', '-weighted_rating', 'title'], name='ranking_trending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titleranking',
+            index=models.Index(fields=['category', '-weighted_rating', 'title'], name='ranking_category_weighted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titleranking',
+            index=models.Index(fields=['category', '-recent_reviews', '-weighted_rating', 'title'], name='ranking_category_trending_idx'),
+        ),
+        migrations.RunPython(fill_rankings, migrations.RunPython.noop),
+    ]
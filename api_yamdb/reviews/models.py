@@ -22,6 +22,10 @@ def validate_year(value):
         raise ValidationError('Произведение еще не вышло')
 
 
+def normalize_name(value):
+    return ' '.join(value.lower().split())
+
+
 class BaseReviewCommentModel(models.Model):
     text = models.TextField('Текст')
     pub_date = models.DateTimeField(
@@ -58,6 +62,13 @@ class Genre(models.Model):
 
 class Title(models.Model):
     name = models.CharField('Название', max_length=NAME_MAX_LENGTH)
+    name_normalized = models.CharField(
+        'Название для поиска',
+        max_length=NAME_MAX_LENGTH,
+        db_index=True,
+        editable=False,
+        default='',
+    )
     description = models.TextField('Описание')
     year = models.IntegerField(
         'Год',
@@ -76,14 +87,31 @@ class Title(models.Model):
         blank=True,
         null=True,
     )
+    rating_sum = models.PositiveIntegerField('Сумма оценок', default=0)
+    rating_count = models.PositiveIntegerField(
+        'Количество оценок', default=0
+    )
+    rating = models.FloatField('Рейтинг', blank=True, null=True)
 
     class Meta:
         verbose_name = 'произведение'
         verbose_name_plural = 'Произведения'
+        indexes = [
+            models.Index(
+                fields=('category', 'year'), name='title_category_year_idx'
+            )
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.name_normalized = normalize_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_normalized'}
+        super().save(*args, **kwargs)
+
 
 class Genre_Title(models.Model):
     title_id = models.ForeignKey(
@@ -129,6 +157,12 @@ class Review(BaseReviewCommentModel):
         verbose_name = 'отзыв'
         verbose_name_plural = 'Отзывы'
         ordering = ('pub_date',)
+        indexes = [
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='review_title_pub_date_idx',
+            )
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=('title', 'author'), name='unique_title_author'
@@ -138,6 +172,13 @@ class Review(BaseReviewCommentModel):
     def __str__(self):
         return f'Отзыв {self.author} на {self.title}'[:MAX_LENGTH_TITLE]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if not instance.get_deferred_fields() & {'title_id', 'score'}:
+            instance._loaded_rating = (instance.title_id, instance.score)
+        return instance
+
 
 class Comment(BaseReviewCommentModel):
     review_id = models.ForeignKey(
@@ -156,6 +197,83 @@ class Comment(BaseReviewCommentModel):
     class Meta:
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(
+                fields=('review_id', 'pub_date', 'id'),
+                name='comment_review_pub_date_idx',
+            )
+        ]
 
     def __str__(self):
         return f'{self.author}: {self.text}'[:MAX_LENGTH_TITLE]
+
+
+class TitleScore(models.Model):
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='scores',
+        verbose_name='Произведение',
+    )
+    score = models.PositiveSmallIntegerField('Оценка')
+    count = models.PositiveIntegerField('Количество отзывов', default=0)
+
+    class Meta:
+        verbose_name = 'распределение оценок'
+        verbose_name_plural = 'Распределения оценок'
+        constraints = [
+            models.UniqueConstraint(
+                fields=('title', 'score'), name='unique_title_score'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.title}: {self.score} x {self.count}'
+
+
+class TitleRanking(models.Model):
+    title = models.OneToOneField(
+        Title,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='ranking',
+        verbose_name='Произведение',
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        verbose_name='Категория',
+    )
+    weighted_rating = models.FloatField('Взвешенный рейтинг', default=0)
+    recent_reviews = models.PositiveIntegerField(
+        'Отзывов за последние дни', default=0
+    )
+    updated_at = models.DateTimeField('Обновлено', auto_now=True)
+
+    class Meta:
+        verbose_name = 'позиция в рейтинге'
+        verbose_name_plural = 'Позиции в рейтинге'
+        indexes = [
+            models.Index(
+                fields=('-weighted_rating', 'title'),
+                name='ranking_weighted_idx',
+            ),
+            models.Index(
+                fields=('-recent_reviews', '-weighted_rating', 'title'),
+                name='ranking_trending_idx',
+            ),
+            models.Index(
+                fields=('category', '-weighted_rating', 'title'),
+                name='ranking_category_weighted_idx',
+            ),
+            models.Index(
+                fields=('category', '-recent_reviews', '-weighted_rating',
+                        'title'),
+                name='ranking_category_trending_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.title}: {self.weighted_rating:.2f}'
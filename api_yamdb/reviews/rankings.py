@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import (
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from .models import Review, Title, TitleRanking
+
+BATCH_SIZE = 1000
+
+
+def weighted_rating():
+    min_reviews = settings.RANKING_MIN_REVIEWS
+    return ExpressionWrapper(
+        (
+            Cast('rating_sum', FloatField())
+            + min_reviews * settings.RANKING_PRIOR_SCORE
+        ) / (F('rating_count') + min_reviews),
+        output_field=FloatField(),
+    )
+
+
+def refresh_rankings(titles=None):
+    if titles is None:
+        titles = Title.objects.all()
+    missing = titles.filter(ranking__isnull=True).values_list('pk', flat=True)
+    TitleRanking.objects.bulk_create(
+        [TitleRanking(title_id=pk) for pk in missing.iterator()],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return update_rankings(titles)
+
+
+def update_rankings(titles):
+    since = timezone.now() - timedelta(days=settings.RANKING_TRENDING_DAYS)
+    title = Title.objects.filter(pk=OuterRef('title'))
+    recent = (
+        Review.objects.filter(title=OuterRef('title'), pub_date__gte=since)
+        .order_by()
+        .values('title')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return TitleRanking.objects.filter(title__in=titles).update(
+        category=Subquery(title.values('category')),
+        weighted_rating=Subquery(
+            title.annotate(weighted=weighted_rating()).values('weighted')
+        ),
+        recent_reviews=Coalesce(Subquery(recent), 0),
+        updated_at=timezone.now(),
+    )
@@ -0,0 +1,164 @@
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    F,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Sum,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
+
+from .consts import MAX_SCORE, MIN_SCORE
+from .models import Review, Title, TitleScore
+
+BATCH_SIZE = 1000
+
+
+def update_rating(title_id, score_delta, count_delta):
+    new_count = F('rating_count') + count_delta
+    Title.objects.filter(pk=title_id).update(
+        rating_sum=F('rating_sum') + score_delta,
+        rating_count=new_count,
+        rating=Case(
+            When(rating_count=-count_delta, then=None),
+            default=(
+                Cast(F('rating_sum') + score_delta, FloatField()) / new_count
+            ),
+            output_field=FloatField(),
+        ),
+    )
+
+
+def update_score_count(title_id, score, delta):
+    scores = TitleScore.objects.filter(title_id=title_id, score=score)
+    if scores.update(count=F('count') + delta) or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            TitleScore.objects.create(
+                title_id=title_id, score=score, count=delta
+            )
+    except IntegrityError:
+        scores.update(count=F('count') + delta)
+
+
+def rebuild_scores(titles):
+    TitleScore.objects.filter(title__in=titles).delete()
+    rows = (
+        Review.objects.filter(title__in=titles)
+        .order_by()
+        .values_list('title', 'score')
+        .annotate(count=Count('pk'))
+        .iterator()
+    )
+    while True:
+        batch = [
+            TitleScore(title_id=title_id, score=score, count=count)
+            for title_id, score, count in islice(rows, BATCH_SIZE)
+        ]
+        if not batch:
+            break
+        TitleScore.objects.bulk_create(batch)
+
+
+def rebuild_ratings(titles=None):
+    if titles is None:
+        titles = Title.objects.all()
+    rebuild_scores(titles)
+    reviews = (
+        Review.objects.filter(title=OuterRef('pk'))
+        .order_by()
+        .values('title')
+    )
+    return titles.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum('score')).values('total')), 0
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(count=Count('pk')).values('count')), 0
+        ),
+        rating=Subquery(reviews.annotate(avg=Avg('score')).values('avg')),
+    )
+
+
+def find_rating_mismatches():
+    titles = Title.objects.order_by('pk').annotate(
+        actual_sum=Coalesce(Sum('reviews__score'), 0),
+        actual_count=Count('reviews'),
+    ).values_list('pk', 'rating_sum', 'rating_count', 'rating',
+                  'actual_sum', 'actual_count')
+    for pk, total, count, rating, actual_sum, actual_count in (
+        titles.iterator()
+    ):
+        actual_rating = actual_sum / actual_count if actual_count else None
+        if (
+            total != actual_sum
+            or count != actual_count
+            or (rating is None) != (actual_rating is None)
+            or rating is not None and abs(rating - actual_rating) > 1e-9
+        ):
+            yield pk, (total, count, rating), (
+                actual_sum, actual_count, actual_rating
+            )
+
+
+def find_score_mismatches():
+    stored = (
+        TitleScore.objects.filter(count__gt=0)
+        .order_by('title', 'score')
+        .values_list('title', 'score', 'count')
+        .iterator()
+    )
+    actual = (
+        Review.objects.order_by('title', 'score')
+        .values_list('title', 'score')
+        .annotate(count=Count('pk'))
+        .iterator()
+    )
+    stored_row, actual_row = next(stored, None), next(actual, None)
+    while stored_row is not None or actual_row is not None:
+        if stored_row == actual_row:
+            stored_row, actual_row = next(stored, None), next(actual, None)
+            continue
+        if actual_row is None or (
+            stored_row is not None and stored_row[:2] < actual_row[:2]
+        ):
+            yield stored_row[0], stored_row[1:], None
+            stored_row = next(stored, None)
+        elif stored_row is None or actual_row[:2] < stored_row[:2]:
+            yield actual_row[0], None, actual_row[1:]
+            actual_row = next(actual, None)
+        else:
+            yield stored_row[0], stored_row[1:], actual_row[1:]
+            stored_row, actual_row = next(stored, None), next(actual, None)
+
+
+def get_title_stats(title):
+    histogram = dict.fromkeys(range(MIN_SCORE, MAX_SCORE + 1), 0)
+    histogram.update(title.scores.filter(count__gt=0).values_list(
+        'score', 'count'
+    ))
+    count = title.rating_count
+    median = None
+    if count:
+        middle = ((count - 1) // 2, count // 2)
+        values, seen = [], 0
+        for score, score_count in histogram.items():
+            values += [
+                score for position in middle
+                if seen <= position < seen + score_count
+            ]
+            seen += score_count
+        median = sum(values) / len(values)
+    return {
+        'count': count,
+        'mean': title.rating,
+        'median': median,
+        'histogram': histogram,
+    }
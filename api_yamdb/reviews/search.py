@@ -0,0 +1,180 @@
+import re
+
+from django.db import connection, connections
+from django.db.models import Q
+
+from .models import Comment, Review, Title
+
+SNIPPET = "snippet({table}, -1, '[', ']', '…', 12)"
+
+SOURCES = {
+    'title': {
+        'table': 'reviews_title',
+        'columns': ('name', 'description'),
+        'select': (
+            "SELECT 'title' AS type, base.id AS id, base.id AS title_id, "
+            'NULL AS review_id, {snippet} AS snippet, bm25({table}) AS rank '
+            'FROM {table} JOIN reviews_title AS base '
+            'ON base.id = {table}.rowid WHERE {table} MATCH %s'
+        ),
+    },
+    'review': {
+        'table': 'reviews_review',
+        'columns': ('text',),
+        'select': (
+            "SELECT 'review' AS type, base.id AS id, base.title_id, "
+            'base.id AS review_id, {snippet} AS snippet, '
+            'bm25({table}) AS rank '
+            'FROM {table} JOIN reviews_review AS base '
+            'ON base.id = {table}.rowid WHERE {table} MATCH %s'
+        ),
+    },
+    'comment': {
+        'table': 'reviews_comment',
+        'columns': ('text',),
+        'select': (
+            "SELECT 'comment' AS type, base.id AS id, review.title_id, "
+            'base.review_id_id AS review_id, {snippet} AS snippet, '
+            'bm25({table}) AS rank '
+            'FROM {table} JOIN reviews_comment AS base '
+            'ON base.id = {table}.rowid '
+            'JOIN reviews_review AS review ON review.id = base.review_id_id '
+            'WHERE {table} MATCH %s'
+        ),
+    },
+}
+COLUMNS = ('type', 'id', 'title_id', 'review_id', 'snippet', 'rank')
+
+
+def fts_table(table):
+    return f'{table}_fts'
+
+
+def create_search_index(sender, using='default', **kwargs):
+    ensure_search_index(connections[using])
+
+
+def ensure_search_index(using_connection=None):
+    using_connection = using_connection or connection
+    if using_connection.vendor != 'sqlite':
+        return
+    with using_connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        for source in SOURCES.values():
+            table, columns = source['table'], source['columns']
+            fts = fts_table(table)
+            triggers = {f'{fts}_ai', f'{fts}_ad', f'{fts}_au'}
+            if fts in existing and triggers <= existing:
+                continue
+            names = ', '.join(columns)
+            new_values = ', '.join(f'new.{column}' for column in columns)
+            old_values = ', '.join(f'old.{column}' for column in columns)
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5('
+                f"{names}, content='{table}', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON '
+                f'{table} BEGIN INSERT INTO {fts}(rowid, {names}) '
+                f'VALUES (new.id, {new_values}); END'
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON '
+                f'{table} BEGIN INSERT INTO {fts}({fts}, rowid, {names}) '
+                f"VALUES ('delete', old.id, {old_values}); END"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF '
+                f'{names} ON {table} BEGIN '
+                f'INSERT INTO {fts}({fts}, rowid, {names}) '
+                f"VALUES ('delete', old.id, {old_values}); "
+                f'INSERT INTO {fts}(rowid, {names}) '
+                f'VALUES (new.id, {new_values}); END'
+            )
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def build_match(query):
+    tokens = re.findall(r'\w+', query)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"' for token in tokens) + '*'
+
+
+class SearchResults:
+    def __init__(self, query, types=None):
+        self.match = build_match(query)
+        self.query = query
+        self.types = [name for name in SOURCES if not types or name in types]
+
+    def selects(self):
+        for name in self.types:
+            table = fts_table(SOURCES[name]['table'])
+            yield SOURCES[name]['select'].format(
+                table=table, snippet=SNIPPET.format(table=table)
+            )
+
+    def count(self):
+        if self.match is None or not self.types:
+            return 0
+        if connection.vendor != 'sqlite':
+            return sum(queryset.count() for queryset in self.fallback())
+        union = ' UNION ALL '.join(self.selects())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM ({union})',
+                [self.match] * len(self.types),
+            )
+            return cursor.fetchone()[0]
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError('Поддерживаются только срезы.')
+        start, stop = index.start or 0, index.stop
+        if self.match is None or not self.types or stop is None:
+            return []
+        if connection.vendor != 'sqlite':
+            return self.fallback_rows(start, stop)
+        union = ' UNION ALL '.join(self.selects())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'{union} ORDER BY rank, type, id LIMIT %s OFFSET %s',
+                [self.match] * len(self.types) + [stop - start, start],
+            )
+            return [dict(zip(COLUMNS, row)) for row in cursor.fetchall()]
+
+    def fallback(self):
+        querysets = {
+            'title': Title.objects.filter(
+                Q(name__icontains=self.query)
+                | Q(description__icontains=self.query)
+            ).values_list('id', 'id', 'id', 'name'),
+            'review': Review.objects.filter(
+                text__icontains=self.query
+            ).values_list('id', 'title_id', 'id', 'text'),
+            'comment': Comment.objects.filter(
+                text__icontains=self.query
+            ).values_list('id', 'review_id__title_id', 'review_id', 'text'),
+        }
+        return [querysets[name].order_by('id') for name in self.types]
+
+    def fallback_rows(self, start, stop):
+        rows = []
+        for name, queryset in zip(self.types, self.fallback()):
+            for pk, title_id, review_id, text in queryset[:stop]:
+                rows.append({
+                    'type': name,
+                    'id': pk,
+                    'title_id': title_id,
+                    'review_id': None if name == 'title' else review_id,
+                    'snippet': text,
+                    'rank': 0.0,
+                })
+        return rows[start:stop]
@@ -0,0 +1,58 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import Signal, receiver
+
+from .models import Review, Title
+from .rankings import refresh_rankings, update_rankings
+from .ratings import rebuild_ratings, update_rating, update_score_count
+
+catalog_changed = Signal()
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    changed = [instance.title_id]
+    if created:
+        update_rating(instance.title_id, instance.score, 1)
+        update_score_count(instance.title_id, instance.score, 1)
+    elif not hasattr(instance, '_loaded_rating'):
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+    else:
+        old_title_id, old_score = instance._loaded_rating
+        if old_title_id != instance.title_id:
+            update_rating(old_title_id, -old_score, -1)
+            update_rating(instance.title_id, instance.score, 1)
+            changed.append(old_title_id)
+        elif old_score != instance.score:
+            update_rating(instance.title_id, instance.score - old_score, 0)
+        else:
+            changed = []
+        if changed:
+            update_score_count(old_title_id, old_score, -1)
+            update_score_count(instance.title_id, instance.score, 1)
+    if not instance.get_deferred_fields() & {'title_id', 'score'}:
+        instance._loaded_rating = (instance.title_id, instance.score)
+    if changed:
+        update_rankings(Title.objects.filter(pk__in=changed))
+        catalog_changed.send(sender=Title, title_ids=changed)
+
+
+@receiver(pre_delete, sender=Review)
+def review_deleting(sender, instance, **kwargs):
+    if instance.get_deferred_fields() & {'title_id', 'score'}:
+        instance.refresh_from_db(fields=('title', 'score'))
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    update_rating(instance.title_id, -instance.score, -1)
+    update_score_count(instance.title_id, instance.score, -1)
+    update_rankings(Title.objects.filter(pk=instance.title_id))
+    catalog_changed.send(sender=Title, title_ids=[instance.title_id])
+
+
+@receiver(post_save, sender=Title)
+def title_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_rankings(Title.objects.filter(pk=instance.pk))
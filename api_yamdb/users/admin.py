@@ -2,6 +2,8 @@ from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
+from .models import OutboxEmail
+
 User = get_user_model()
 
 
@@ -10,3 +12,12 @@ class UserAdmin(BaseUserAdmin):
     fieldsets = (
         ('Extra Fields', {'fields': ('bio', 'role',)}),
     )
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        'recipient', 'subject', 'status', 'attempts', 'next_attempt_at'
+    )
+    list_filter = ('status',)
+    search_fields = ('recipient',)
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+from .tokens import get_auth_version
+
+
+class ClaimsUser(TokenUser):
+    @cached_property
+    def role(self):
+        return self.token.get('role', User.Role.USER)
+
+    @cached_property
+    def is_admin(self):
+        return self.role == User.Role.ADMIN
+
+    @cached_property
+    def is_moderator(self):
+        return self.role == User.Role.MODERATOR
+
+
+class VerifiedTokenCache:
+    def __init__(self, size):
+        self.size = size
+        self.tokens = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, raw_token):
+        with self.lock:
+            token = self.tokens.get(raw_token)
+            if token is None:
+                return None
+            if token['exp'] <= time():
+                del self.tokens[raw_token]
+                return None
+            self.tokens.move_to_end(raw_token)
+            return token
+
+    def set(self, raw_token, token):
+        if not self.size:
+            return
+        with self.lock:
+            self.tokens[raw_token] = token
+            self.tokens.move_to_end(raw_token)
+            if len(self.tokens) > self.size:
+                self.tokens.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.tokens.clear()
+
+
+verified_tokens = VerifiedTokenCache(settings.JWT_VERIFIED_CACHE_SIZE)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_validated_token(self, raw_token):
+        token = verified_tokens.get(raw_token)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            verified_tokens.set(raw_token, token)
+        return token
+
+    def get_user(self, validated_token):
+        if 'ver' not in validated_token:
+            return super().get_user(validated_token)
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        if get_auth_version(user_id) != validated_token['ver']:
+            raise AuthenticationFailed('Токен отозван.', code='token_revoked')
+        return ClaimsUser(validated_token)
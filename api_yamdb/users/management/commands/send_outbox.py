@@ -0,0 +1,62 @@
+from datetime import timedelta
+from time import sleep
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.outbox import process_batch
+
+
+class Command(BaseCommand):
+    help = 'Отправляет письма из очереди исходящих писем.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Сколько писем забирать из очереди за раз.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Количество потоков отправки.',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=5,
+            help='После стольких неудач письмо помечается неотправленным.',
+        )
+        parser.add_argument(
+            '--backoff',
+            type=int,
+            default=30,
+            help='Пауза перед первой повторной попыткой, в секундах.',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Не завершаться, а проверять очередь каждые --interval с.',
+        )
+        parser.add_argument('--interval', type=float, default=5)
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError(
+                'Размер пачки и число потоков должны быть положительными.'
+            )
+        backoff = timedelta(seconds=options['backoff'])
+        while True:
+            sent, failed = process_batch(
+                options['batch_size'],
+                options['workers'],
+                options['max_attempts'],
+                backoff,
+            )
+            if sent or failed:
+                self.stdout.write(f'Отправлено: {sent}, ошибок: {failed}')
+            elif options['loop']:
+                sleep(options['interval'])
+            else:
+                break
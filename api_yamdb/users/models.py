@@ -2,6 +2,7 @@ from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 from django.db import models
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
 
 def name_validator(value):
@@ -39,6 +40,11 @@ class User(AbstractUser):
     role = models.CharField(
         'Роль', choices=Role.choices, default=Role.USER, max_length=10
     )
+    auth_version = models.PositiveIntegerField(
+        'Версия авторизации', default=1, editable=False
+    )
+
+    AUTH_FIELDS = ('username', 'role', 'is_superuser', 'is_active')
 
     @property
     def is_admin(self):
@@ -52,3 +58,69 @@ class User(AbstractUser):
         ordering = ['-id']
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_auth = instance.get_auth_state()
+        return instance
+
+    def get_auth_state(self):
+        return tuple(self.__dict__.get(field) for field in self.AUTH_FIELDS)
+
+    def save(self, *args, **kwargs):
+        loaded = self.__dict__.get('_loaded_auth')
+        if loaded is not None and loaded != self.get_auth_state():
+            self.auth_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'auth_version'}
+        super().save(*args, **kwargs)
+        self._loaded_auth = self.get_auth_state()
+
+    def revoke_tokens(self):
+        self.auth_version += 1
+        self.save(update_fields=('auth_version',))
+
+
+class OutboxEmail(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Ожидает отправки'
+        SENDING = 'sending', 'Отправляется'
+        SENT = 'sent', 'Отправлено'
+        FAILED = 'failed', 'Не отправлено'
+
+    recipient = models.EmailField('Получатель', max_length=254)
+    from_email = models.EmailField('Отправитель', max_length=254)
+    subject = models.CharField('Тема', max_length=255)
+    body = models.TextField('Текст')
+    status = models.CharField(
+        'Статус',
+        choices=Status.choices,
+        default=Status.PENDING,
+        max_length=10,
+    )
+    attempts = models.PositiveSmallIntegerField('Попыток', default=0)
+    next_attempt_at = models.DateTimeField(
+        'Следующая попытка', default=timezone.now
+    )
+    last_error = models.TextField('Последняя ошибка', blank=True)
+    claim_token = models.CharField(
+        'Метка обработчика', max_length=32, blank=True, editable=False
+    )
+    created_at = models.DateTimeField('Создано', auto_now_add=True)
+    sent_at = models.DateTimeField('Отправлено', blank=True, null=True)
+
+    class Meta:
+        ordering = ['next_attempt_at']
+        verbose_name = 'Исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+        indexes = [
+            models.Index(
+                fields=('status', 'next_attempt_at'),
+                name='outbox_status_next_attempt_idx',
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.recipient}: {self.subject}'
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+LEASE = timedelta(minutes=5)
+
+
+def enqueue_email(recipient, subject, body, from_email):
+    return OutboxEmail.objects.create(
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        from_email=from_email,
+    )
+
+
+def claim_batch(batch_size):
+    now = timezone.now()
+    token = uuid4().hex
+    due = OutboxEmail.objects.filter(
+        Q(status=OutboxEmail.Status.PENDING)
+        | Q(status=OutboxEmail.Status.SENDING),
+        next_attempt_at__lte=now,
+    )
+    with transaction.atomic():
+        candidates = due.order_by('next_attempt_at')
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        ids = list(candidates.values_list('pk', flat=True)[:batch_size])
+        due.filter(pk__in=ids).update(
+            status=OutboxEmail.Status.SENDING,
+            next_attempt_at=now + LEASE,
+            claim_token=token,
+        )
+    return list(OutboxEmail.objects.filter(pk__in=ids, claim_token=token))
+
+
+def send_chunk(emails):
+    results = []
+    try:
+        with get_connection() as mail_connection:
+            for email in emails:
+                message = EmailMessage(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=email.from_email,
+                    to=[email.recipient],
+                    connection=mail_connection,
+                )
+                try:
+                    message.send()
+                except Exception as error:
+                    results.append((email, error))
+                else:
+                    results.append((email, None))
+    except Exception as error:
+        done = {email.pk for email, _ in results}
+        results += [
+            (email, error) for email in emails if email.pk not in done
+        ]
+    return results
+
+
+def record_results(results, max_attempts, backoff):
+    now = timezone.now()
+    sent = [email.pk for email, error in results if error is None]
+    OutboxEmail.objects.filter(pk__in=sent).update(
+        status=OutboxEmail.Status.SENT,
+        sent_at=now,
+        attempts=F('attempts') + 1,
+        last_error='',
+    )
+    for email, error in results:
+        if error is None:
+            continue
+        attempts = email.attempts + 1
+        if attempts >= max_attempts:
+            status = OutboxEmail.Status.FAILED
+        else:
+            status = OutboxEmail.Status.PENDING
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            status=status,
+            attempts=attempts,
+            last_error=str(error),
+            next_attempt_at=now + backoff * 2 ** (attempts - 1),
+        )
+    return len(sent), len(results) - len(sent)
+
+
+def process_batch(batch_size, workers, max_attempts, backoff):
+    emails = claim_batch(batch_size)
+    if not emails:
+        return 0, 0
+    chunks = [emails[index::workers] for index in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = [
+            result
+            for chunk_results in executor.map(send_chunk, filter(None, chunks))
+            for result in chunk_results
+        ]
+    return record_results(results, max_attempts, backoff)
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User
+from .tokens import set_auth_version
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, **kwargs):
+    set_auth_version(instance.pk, instance.auth_version)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    set_auth_version(instance.pk, None)
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+VERSION_KEY = 'auth-version:{}'
+
+
+def get_version_cache():
+    return caches[settings.AUTH_VERSION_CACHE_ALIAS]
+
+
+def get_auth_version(user_id):
+    cache = get_version_cache()
+    key = VERSION_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            get_user_model().objects.filter(pk=user_id)
+            .values_list('auth_version', flat=True).first()
+        )
+        if version is None:
+            return None
+        cache.set(key, version, settings.AUTH_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def set_auth_version(user_id, version):
+    key = VERSION_KEY.format(user_id)
+    if version is None:
+        get_version_cache().delete(key)
+    else:
+        get_version_cache().set(
+            key, version, settings.AUTH_VERSION_CACHE_TIMEOUT
+        )
+
+
+class UserAccessToken(AccessToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['username'] = user.username
+        token['role'] = user.role
+        token['is_superuser'] = user.is_superuser
+        token['ver'] = user.auth_version
+        return token
+
+
+class UserRefreshToken(RefreshToken):
+    access_token_class = UserAccessToken
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['ver'] = user.auth_version
+        return token
+
+
+def refresh_access_token(raw_token):
+    refresh = UserRefreshToken(raw_token)
+    user = get_user_model().objects.filter(
+        pk=refresh[api_settings.USER_ID_CLAIM], is_active=True
+    ).first()
+    if user is None or refresh.get('ver') != user.auth_version:
+        raise TokenError('Токен отозван.')
+    return UserAccessToken.for_user(user)
@@ -0,0 +1,70 @@
+"""Проверка объектных прав на длинных списках отзывов.
+
+Сравнивает составное правило ``IsAuthor | IsModerator | IsAdmin`` с
+``IsAuthorOrStaff`` для автора, чужого пользователя, модератора и
+администратора. Каждый прогон — один запрос и ``--objects`` объектов.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.permissions --objects 500 --repeat 200
+"""
+import argparse
+
+from benchmarks.utils import dump, setup_django, summarize, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--objects', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    setup_django()
+
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from api.permissions import IsAdmin, IsAuthor, IsAuthorOrStaff, IsModerator
+    from reviews.models import Review
+    from users.authentication import ClaimsUser
+    from users.models import User
+    from users.tokens import UserAccessToken
+
+    factory = APIRequestFactory()
+    rules = {
+        'composite': IsAuthor | IsModerator | IsAdmin,
+        'compiled': IsAuthorOrStaff,
+    }
+    users = {
+        'author': User(pk=1, username='author'),
+        'other': User(pk=2, username='other'),
+        'moderator': User(pk=3, username='moderator', role='moderator'),
+        'admin': User(pk=4, username='admin', role='admin'),
+    }
+    objects = [Review(pk=idx, author_id=1) for idx in range(args.objects)]
+
+    def check(rule, user):
+        request = Request(factory.patch('/'))
+        request.user = user
+        permission = rule()
+        return sum(
+            permission.has_permission(request, None)
+            and permission.has_object_permission(request, None, obj)
+            for obj in objects
+        )
+
+    results = {}
+    for name, rule in rules.items():
+        for role, user in users.items():
+            user = ClaimsUser(UserAccessToken.for_user(user))
+            timings = []
+            for _ in range(args.repeat):
+                elapsed, allowed = timed(check, rule, user)
+                timings.append(elapsed)
+            results.setdefault(name, {})[role] = {
+                **summarize(timings), 'allowed': allowed,
+            }
+    dump(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Сериализация и рендеринг страниц произведений и отзывов.
+
+Сравнивает ``TitleSerializer``/``ReviewSerializer`` с ``JSONRenderer`` и
+быстрый путь списков: строки ``.values()``, ``TitleValuesSerializer``/
+``ReviewValuesSerializer`` и ``FastJSONRenderer``. В замер входят запросы
+к базе, сборка ответа и кодирование JSON.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.rendering --page-sizes 10 100 1000 --repeat 20
+"""
+import argparse
+
+from benchmarks.seed import seed
+from benchmarks.utils import dump, setup_django, summarize, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--page-sizes', type=int, nargs='+', default=[10, 100, 1000]
+    )
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from api.renderers import FastJSONRenderer
+    from api.serializers import (
+        ReviewSerializer,
+        ReviewValuesSerializer,
+        TitleSerializer,
+        TitleValuesSerializer,
+    )
+    from reviews.models import Review, Title
+
+    largest = max(args.page_sizes)
+    seed(titles=largest, reviews=largest, comments=0, users=10)
+    datasets = {
+        'titles': (
+            Title.objects.select_related('category')
+            .prefetch_related('genre').order_by('pk'),
+            TitleSerializer,
+            TitleValuesSerializer,
+        ),
+        'reviews': (
+            Review.objects.select_related('author').order_by('pk'),
+            ReviewSerializer,
+            ReviewValuesSerializer,
+        ),
+    }
+
+    def render_models(queryset, serializer_class, size):
+        serializer = serializer_class(list(queryset[:size]), many=True)
+        return JSONRenderer().render(serializer.data)
+
+    def render_values(queryset, serializer_class, size):
+        rows = queryset.prefetch_related(None).values(
+            *serializer_class.values
+        )
+        serializer = serializer_class(list(rows[:size]), many=True)
+        return FastJSONRenderer().render(serializer.data)
+
+    results = {}
+    for name, (queryset, serializer_class, values_class) in datasets.items():
+        for size in args.page_sizes:
+            for mode, render, cls in (
+                ('serializer', render_models, serializer_class),
+                ('values', render_values, values_class),
+            ):
+                timings = []
+                for _ in range(args.repeat):
+                    elapsed, content = timed(render, queryset, cls, size)
+                    timings.append(elapsed)
+                results.setdefault(name, {}).setdefault(str(size), {})[
+                    mode
+                ] = {**summarize(timings), 'bytes': len(content)}
+    dump(results)
+
+
+if __name__ == '__main__':
+    main()
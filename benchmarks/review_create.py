@@ -0,0 +1,68 @@
+"""Задержка POST /api/v1/titles/{title_id}/reviews/.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.review_create --users 300
+"""
+import argparse
+
+from benchmarks.utils import dump, setup_django, summarize, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=300)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    from reviews.models import Title
+    from users.tokens import UserAccessToken
+
+    User = get_user_model()
+    title = Title.objects.create(name='Произведение', year=2000)
+    users = User.objects.bulk_create(
+        User(username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+        for idx in range(args.users)
+    )
+    users = User.objects.order_by('pk')
+    url = f'/api/v1/titles/{title.pk}/reviews/'
+    data = {'text': 'Отзыв', 'score': 7}
+
+    clients = []
+    for user in users:
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {UserAccessToken.for_user(user)}'
+        )
+        clients.append(client)
+
+    created, duplicates = [], []
+    queries = {}
+    for client in clients:
+        with CaptureQueriesContext(connection) as context:
+            elapsed, response = timed(client.post, url, data=data)
+        assert response.status_code == 201, response.content
+        queries.setdefault('created', len(context))
+        created.append(elapsed)
+    for client in clients:
+        with CaptureQueriesContext(connection) as context:
+            elapsed, response = timed(client.post, url, data=data)
+        assert response.status_code == 400, response.content
+        queries.setdefault('duplicate', len(context))
+        duplicates.append(elapsed)
+
+    dump({
+        'created': {**summarize(created), 'queries': queries['created']},
+        'duplicate': {
+            **summarize(duplicates), 'queries': queries['duplicate']
+        },
+    })
+
+
+if __name__ == '__main__':
+    main()
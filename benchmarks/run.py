@@ -0,0 +1,487 @@
+"""Пропускная способность и задержки всех маршрутов из ``api/urls.py``.
+
+Каждый маршрут измеряется тестовым клиентом Django и через настоящий
+WSGI-сервер; через ASGI — если установлен ``uvicorn``. Результат
+выводится в JSON, чтобы сравнивать его между коммитами.
+
+Запуск из корня репозитория (база без данных заполняется
+``benchmarks.seed``):
+
+    python -m benchmarks.run --requests 200 > before.json
+    python -m benchmarks.run --database /tmp/yamdb.sqlite3 --modes wsgi
+"""
+import argparse
+import json
+import platform
+import subprocess
+from collections import namedtuple
+from http.client import HTTPConnection
+from time import perf_counter
+from urllib.parse import quote, urlsplit
+
+from benchmarks.seed import seed
+from benchmarks.utils import (
+    BASE_DIR,
+    dump,
+    serve_asgi,
+    serve_wsgi,
+    setup_django,
+    summarize,
+)
+
+MODES = ('client', 'wsgi', 'asgi')
+
+Route = namedtuple(
+    'Route',
+    ('name', 'method', 'path', 'role', 'data', 'setup', 'teardown'),
+    defaults=(None, None, None, None),
+)
+
+
+def create_category(ctx):
+    from reviews.models import Category
+
+    Category.objects.get_or_create(slug='bench-delete', name='Удаляемая')
+
+
+def create_genre(ctx):
+    from reviews.models import Genre
+
+    Genre.objects.get_or_create(slug='bench-delete', name='Удаляемый')
+
+
+def create_title(ctx):
+    from reviews.models import Title
+
+    ctx['temp_title'] = Title.objects.create(
+        name='Удаляемое произведение', year=2000
+    ).pk
+
+
+def create_review(ctx):
+    from reviews.models import Review
+
+    ctx['temp_review'] = Review.objects.create(
+        title_id=ctx['title'], author_id=ctx['admin_id'], text='x', score=5
+    ).pk
+
+
+def create_comment(ctx):
+    from reviews.models import Comment
+
+    ctx['temp_comment'] = Comment.objects.create(
+        review_id_id=ctx['review'], author_id=ctx['admin_id'], text='x'
+    ).pk
+
+
+def create_user(ctx):
+    from django.contrib.auth import get_user_model
+
+    get_user_model().objects.get_or_create(
+        username='bench_delete', email='bench_delete@yamdb.fake'
+    )
+
+
+def delete_by(model_path, field='pk', key='id'):
+    def teardown(ctx, body):
+        from django.apps import apps
+
+        apps.get_model(model_path).objects.filter(
+            **{field: body[key]}
+        ).delete()
+    return teardown
+
+
+ROUTES = (
+    Route('api-root', 'GET', '/api/v1/', 'user'),
+    Route('signup', 'POST', '/api/v1/auth/signup/', data={
+        'username': 'bench_signup', 'email': 'bench_signup@yamdb.fake'
+    }),
+    Route('token', 'POST', '/api/v1/auth/token/', data={
+        'username': '{username}', 'confirmation_code': '{code}'
+    }),
+    Route('token-refresh', 'POST', '/api/v1/auth/token/refresh/', data={
+        'refresh': '{refresh}'
+    }),
+    Route('users-list', 'GET', '/api/v1/users/', 'admin'),
+    Route(
+        'users-create', 'POST', '/api/v1/users/', 'admin',
+        {'username': 'bench_new', 'email': 'bench_new@yamdb.fake'},
+        teardown=delete_by('users.User', 'username', 'username'),
+    ),
+    Route('users-detail', 'GET', '/api/v1/users/{username}/', 'admin'),
+    Route(
+        'users-update', 'PATCH', '/api/v1/users/{username}/', 'admin',
+        {'bio': 'Бенчмарк'},
+    ),
+    Route(
+        'users-delete', 'DELETE', '/api/v1/users/bench_delete/', 'admin',
+        setup=create_user,
+    ),
+    Route('users-me', 'GET', '/api/v1/users/me/', 'user'),
+    Route(
+        'users-me-update', 'PATCH', '/api/v1/users/me/', 'user',
+        {'bio': 'Бенчмарк'},
+    ),
+    Route('titles-list', 'GET', '/api/v1/titles/'),
+    Route(
+        'titles-list-filtered', 'GET',
+        '/api/v1/titles/?category_slug={category}&name_prefix=д',
+    ),
+    Route(
+        'titles-create', 'POST', '/api/v1/titles/', 'admin',
+        {'name': 'Бенчмарк', 'year': 2000, 'genre': ['{genre}'],
+         'category': '{category}'},
+        teardown=delete_by('reviews.Title'),
+    ),
+    Route('titles-detail', 'GET', '/api/v1/titles/{title}/'),
+    Route(
+        'titles-update', 'PATCH', '/api/v1/titles/{title}/', 'admin',
+        {'description': 'Бенчмарк'},
+    ),
+    Route(
+        'titles-delete', 'DELETE', '/api/v1/titles/{temp_title}/', 'admin',
+        setup=create_title,
+    ),
+    Route('titles-top', 'GET', '/api/v1/titles/top/?category={category}'),
+    Route('titles-trending', 'GET', '/api/v1/titles/trending/'),
+    Route('titles-stats', 'GET', '/api/v1/titles/{title}/stats/'),
+    Route(
+        'titles-bulk', 'POST', '/api/v1/titles/bulk/', 'admin',
+        [{'id': '{title}', 'description': 'Бенчмарк'}],
+    ),
+    Route('categories-list', 'GET', '/api/v1/categories/'),
+    Route(
+        'categories-create', 'POST', '/api/v1/categories/', 'admin',
+        {'name': 'Бенчмарк', 'slug': 'bench-new'},
+        teardown=delete_by('reviews.Category', 'slug', 'slug'),
+    ),
+    Route(
+        'categories-delete', 'DELETE', '/api/v1/categories/bench-delete/',
+        'admin', setup=create_category,
+    ),
+    Route('genres-list', 'GET', '/api/v1/genres/'),
+    Route(
+        'genres-create', 'POST', '/api/v1/genres/', 'admin',
+        {'name': 'Бенчмарк', 'slug': 'bench-new'},
+        teardown=delete_by('reviews.Genre', 'slug', 'slug'),
+    ),
+    Route(
+        'genres-delete', 'DELETE', '/api/v1/genres/bench-delete/', 'admin',
+        setup=create_genre,
+    ),
+    Route('reviews-list', 'GET', '/api/v1/titles/{title}/reviews/'),
+    Route(
+        'reviews-list-cursor', 'GET',
+        '/api/v1/titles/{title}/reviews/?cursor=',
+    ),
+    Route(
+        'reviews-create', 'POST', '/api/v1/titles/{title}/reviews/', 'admin',
+        {'text': 'Бенчмарк', 'score': 7},
+        teardown=delete_by('reviews.Review'),
+    ),
+    Route(
+        'reviews-detail', 'GET', '/api/v1/titles/{title}/reviews/{review}/'
+    ),
+    Route(
+        'reviews-update', 'PATCH',
+        '/api/v1/titles/{title}/reviews/{own_review}/', 'user',
+        {'text': 'Бенчмарк'},
+    ),
+    Route(
+        'reviews-delete', 'DELETE',
+        '/api/v1/titles/{title}/reviews/{temp_review}/', 'admin',
+        setup=create_review,
+    ),
+    Route(
+        'comments-list', 'GET',
+        '/api/v1/titles/{title}/reviews/{review}/comments/',
+    ),
+    Route(
+        'comments-create', 'POST',
+        '/api/v1/titles/{title}/reviews/{review}/comments/', 'user',
+        {'text': 'Бенчмарк'},
+        teardown=delete_by('reviews.Comment'),
+    ),
+    Route(
+        'comments-detail', 'GET',
+        '/api/v1/titles/{title}/reviews/{review}/comments/{comment}/',
+    ),
+    Route(
+        'comments-update', 'PATCH',
+        '/api/v1/titles/{title}/reviews/{review}/comments/{own_comment}/',
+        'user', {'text': 'Бенчмарк'},
+    ),
+    Route(
+        'comments-delete', 'DELETE',
+        '/api/v1/titles/{title}/reviews/{review}/comments/{temp_comment}/',
+        'admin', setup=create_comment,
+    ),
+    Route('search', 'GET', '/api/v1/search/?q=дюна'),
+    Route('export-csv', 'GET', '/api/v1/export/titles.csv', 'admin'),
+    Route('export-ndjson', 'GET', '/api/v1/export/reviews.ndjson', 'admin'),
+    Route('metrics', 'GET', '/api/v1/metrics/', 'admin'),
+)
+
+
+def fill(value, ctx):
+    if isinstance(value, str):
+        return value.format(**ctx)
+    if isinstance(value, dict):
+        return {key: fill(item, ctx) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill(item, ctx) for item in value]
+    return value
+
+
+def prepare_context():
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.tokens import default_token_generator
+
+    from reviews.models import Category, Comment, Genre, Review, Title
+    from users.tokens import UserAccessToken, UserRefreshToken
+
+    User = get_user_model()
+    admin, _ = User.objects.get_or_create(
+        username='bench_admin',
+        defaults={'email': 'bench_admin@yamdb.fake', 'role': 'admin'},
+    )
+    user, _ = User.objects.get_or_create(
+        username='bench_user', defaults={'email': 'bench_user@yamdb.fake'}
+    )
+    title = Title.objects.filter(reviews__isnull=False).order_by('pk').first()
+    if title is None:
+        raise SystemExit('В базе нет произведений с отзывами.')
+    review = title.reviews.exclude(author=user).order_by('pk').first()
+    own_review, _ = Review.objects.get_or_create(
+        title=title, author=user, defaults={'text': 'Отзыв', 'score': 5}
+    )
+    comment = Comment.objects.filter(review_id=review).order_by('pk').first()
+    own_comment = Comment.objects.create(
+        review_id=review, author=user, text='Комментарий'
+    )
+    return {
+        'admin_id': admin.pk,
+        'username': user.username,
+        'code': default_token_generator.make_token(user),
+        'refresh': str(UserRefreshToken.for_user(user)),
+        'title': title.pk,
+        'review': review.pk,
+        'own_review': own_review.pk,
+        'comment': (comment or own_comment).pk,
+        'own_comment': own_comment.pk,
+        'category': Category.objects.order_by('pk').first().slug,
+        'genre': Genre.objects.order_by('pk').first().slug,
+        'tokens': {
+            'admin': str(UserAccessToken.for_user(admin)),
+            'user': str(UserAccessToken.for_user(user)),
+        },
+    }
+
+
+def auth_headers(route, ctx):
+    if route.role is None:
+        return {}
+    return {'Authorization': f'Bearer {ctx["tokens"][route.role]}'}
+
+
+def client_sender(ctx):
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+
+    def send(route, path, body):
+        headers = auth_headers(route, ctx)
+        extra = {'HTTP_AUTHORIZATION': headers['Authorization']} if (
+            headers
+        ) else {}
+        response = client.generic(
+            route.method, path, body, content_type='application/json',
+            **extra
+        )
+        if response.streaming:
+            content = b''.join(response.streaming_content)
+        else:
+            content = response.content
+        return response.status_code, response.get('Content-Type', ''), content
+    return send
+
+
+def http_sender(base_url, ctx):
+    location = urlsplit(base_url)
+    connection = HTTPConnection(location.hostname, location.port)
+
+    def send(route, path, body):
+        headers = {'Content-Type': 'application/json'}
+        headers.update(auth_headers(route, ctx))
+        connection.request(
+            route.method, quote(path, safe='/?&='),
+            body=body.encode() or None, headers=headers,
+        )
+        response = connection.getresponse()
+        content = response.read()
+        if response.getheader('Connection', '').lower() == 'close':
+            connection.close()
+        return (
+            response.status, response.getheader('Content-Type', ''), content
+        )
+    return send
+
+
+def measure(route, send, ctx, requests, warmup, count_queries):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings, statuses = [], {}
+    queries = None
+    for idx in range(warmup + requests):
+        if route.setup is not None:
+            route.setup(ctx)
+        path = fill(route.path, ctx)
+        body = json.dumps(fill(route.data, ctx)) if route.data else ''
+        with CaptureQueriesContext(connection) as context:
+            started = perf_counter()
+            status, content_type, content = send(route, path, body)
+            elapsed = perf_counter() - started
+        if idx < warmup:
+            queries = len(context) if count_queries else None
+        else:
+            timings.append(elapsed)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        if route.teardown is not None and status < 300:
+            route.teardown(ctx, json.loads(content))
+    result = {**summarize(timings), 'statuses': statuses}
+    if queries is not None:
+        result['queries'] = queries
+    return result
+
+
+def measure_all(routes, send, ctx, requests, warmup, count_queries=False):
+    return {
+        route.name: measure(
+            route, send, ctx, requests, warmup, count_queries
+        )
+        for route in routes
+    }
+
+
+def api_routes():
+    from django.urls import get_resolver
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern).lstrip('^')
+            if hasattr(pattern, 'url_patterns'):
+                yield from walk(pattern.url_patterns, route)
+            elif '(?P<format>' not in route:
+                yield route
+
+    return {
+        route for route in walk(get_resolver().url_patterns, '')
+        if route.startswith('api/')
+    }
+
+
+def uncovered_routes(ctx):
+    from django.urls import resolve
+
+    ctx = {**ctx, 'temp_title': 0, 'temp_review': 0, 'temp_comment': 0}
+    covered = {
+        resolve(fill(route.path, ctx).split('?')[0]).route
+        for route in ROUTES
+    }
+    return sorted(api_routes() - covered)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', 'HEAD'), cwd=BASE_DIR, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--database')
+    parser.add_argument('--titles', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=10000)
+    parser.add_argument('--comments', type=int, default=10000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument(
+        '--routes', help='Имена маршрутов через запятую; по умолчанию все.'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Отключить кэш ответов API.',
+    )
+    args = parser.parse_args()
+    database = setup_django(args.database)
+
+    from django.conf import settings
+    from django.db import connection
+    from reviews.models import Title
+
+    if args.no_cache:
+        settings.CACHES['benchmark'] = {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache'
+        }
+        settings.API_CACHE_ALIAS = 'benchmark'
+    scale = None
+    if not Title.objects.exists():
+        scale = seed(
+            titles=args.titles, reviews=args.reviews,
+            comments=args.comments, users=args.users,
+        )
+    ctx = prepare_context()
+    routes = ROUTES
+    if args.routes:
+        names = set(args.routes.split(','))
+        routes = [route for route in ROUTES if route.name in names]
+
+    results = {}
+    for mode in args.modes.split(','):
+        if mode == 'client':
+            send = client_sender(ctx)
+            results[mode] = measure_all(
+                routes, send, ctx, args.requests, args.warmup,
+                count_queries=True,
+            )
+            continue
+        if mode == 'asgi':
+            try:
+                import uvicorn  # noqa: F401
+            except ImportError:
+                results[mode] = {'skipped': 'uvicorn не установлен'}
+                continue
+        server = serve_wsgi if mode == 'wsgi' else serve_asgi
+        connection.close()
+        with server() as base_url:
+            results[mode] = measure_all(
+                routes, http_sender(base_url, ctx), ctx,
+                args.requests, args.warmup,
+            )
+
+    dump({
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'database': str(database),
+            'seed': scale,
+            'requests': args.requests,
+            'cache': not args.no_cache,
+        },
+        'uncovered_routes': uncovered_routes(ctx),
+        'results': results,
+    })
+
+
+if __name__ == '__main__':
+    main()
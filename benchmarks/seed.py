@@ -0,0 +1,191 @@
+"""Синтетический набор данных для бенчмарков.
+
+Создаёт пользователей, категории, жанры, произведения, отзывы и
+комментарии через слой моделей пачками ``bulk_create``. Повторный запуск
+с тем же ``--random-seed`` даёт тот же набор данных.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.seed --database /tmp/yamdb.sqlite3 \\
+        --titles 100000 --reviews 10000000 --users 1000
+"""
+import argparse
+import random
+from datetime import timedelta
+from itertools import islice
+from time import perf_counter
+
+from benchmarks.utils import dump, setup_django
+
+WORDS = (
+    'дюна', 'звезда', 'ночь', 'город', 'море', 'война', 'мир', 'дорога',
+    'тень', 'огонь', 'песня', 'остров', 'сад', 'зима', 'лето', 'башня',
+    'король', 'ветер', 'память', 'сон', 'река', 'гора', 'лес', 'время',
+)
+
+
+def batched(objects, batch_size):
+    while True:
+        batch = list(islice(objects, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def sentence(rng, length):
+    return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize()
+
+
+def seed(titles=1000, reviews=20000, comments=20000, users=100,
+         categories=10, genres=20, batch_size=5000, random_seed=0):
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.utils import timezone
+
+    from reviews.management.commands.import_csv import explicit_pub_date
+    from reviews.models import (
+        Category,
+        Comment,
+        Genre,
+        Genre_Title,
+        Review,
+        Title,
+        normalize_name,
+    )
+    from reviews.rankings import refresh_rankings
+    from reviews.ratings import rebuild_ratings
+
+    User = get_user_model()
+    if reviews and not titles:
+        raise ValueError('Для отзывов нужны произведения.')
+    per_title = -(-reviews // titles) if titles else 0
+    if per_title > users:
+        raise ValueError(
+            f'Для {reviews} отзывов на {titles} произведений нужно не '
+            f'меньше {per_title} пользователей.'
+        )
+    rng = random.Random(random_seed)
+    now = timezone.now()
+    timings = {}
+
+    def insert(name, model, objects):
+        started = perf_counter()
+        for batch in batched(objects, batch_size):
+            model.objects.bulk_create(batch)
+        timings[name] = round(perf_counter() - started, 3)
+
+    password = make_password(None)
+    insert('users', User, (
+        User(
+            username=f'seed{idx}',
+            email=f'seed{idx}@yamdb.fake',
+            password=password,
+        )
+        for idx in range(users)
+    ))
+    insert('categories', Category, (
+        Category(name=f'Категория {idx}', slug=f'category-{idx}')
+        for idx in range(categories)
+    ))
+    insert('genres', Genre, (
+        Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+        for idx in range(genres)
+    ))
+    user_ids = list(
+        User.objects.filter(username__startswith='seed')
+        .order_by('pk').values_list('pk', flat=True)
+    )
+    category_ids = list(Category.objects.values_list('pk', flat=True))
+    genre_ids = list(Genre.objects.values_list('pk', flat=True))
+    max_genres = min(3, len(genre_ids))
+
+    def make_title(idx):
+        name = f'{sentence(rng, 2)} {idx}'
+        return Title(
+            name=name,
+            name_normalized=normalize_name(name),
+            year=rng.randint(1950, now.year),
+            description=sentence(rng, 12),
+            category_id=rng.choice(category_ids),
+        )
+
+    insert('titles', Title, (make_title(idx) for idx in range(titles)))
+    title_ids = list(
+        Title.objects.order_by('pk').values_list('pk', flat=True)
+    )[-titles:] if titles else []
+    insert('genre_titles', Genre_Title, (
+        Genre_Title(title_id_id=title_id, genre_id_id=genre_id)
+        for title_id in title_ids
+        for genre_id in rng.sample(
+            genre_ids, rng.randint(min(1, max_genres), max_genres)
+        )
+    ))
+
+    def make_review(idx):
+        title_idx, offset = idx % titles, idx // titles
+        return Review(
+            title_id=title_ids[title_idx],
+            author_id=user_ids[(title_idx + offset) % users],
+            text=sentence(rng, 30),
+            score=rng.randint(1, 10),
+            pub_date=now - timedelta(minutes=rng.randint(0, 525600)),
+        )
+
+    with explicit_pub_date(Review, Comment):
+        insert(
+            'reviews', Review, (make_review(idx) for idx in range(reviews))
+        )
+        review_count = Review.objects.count()
+        per_review, extra = divmod(comments, review_count or 1)
+        review_ids = Review.objects.order_by('pk').values_list(
+            'pk', flat=True
+        ).iterator(chunk_size=batch_size)
+        insert('comments', Comment, (
+            Comment(
+                review_id_id=review_id,
+                author_id=rng.choice(user_ids),
+                text=sentence(rng, 15),
+                pub_date=now - timedelta(minutes=rng.randint(0, 525600)),
+            )
+            for position, review_id in enumerate(review_ids)
+            for _ in range(per_review + (position < extra))
+        ))
+
+    started = perf_counter()
+    rebuild_ratings()
+    refresh_rankings()
+    timings['ratings'] = round(perf_counter() - started, 3)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--titles', type=int, default=1000)
+    parser.add_argument('--reviews', type=int, default=20000)
+    parser.add_argument('--comments', type=int, default=20000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--categories', type=int, default=10)
+    parser.add_argument('--genres', type=int, default=20)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--random-seed', type=int, default=0)
+    args = parser.parse_args()
+    setup_django(args.database)
+    dump({
+        'seed': seed(
+            titles=args.titles,
+            reviews=args.reviews,
+            comments=args.comments,
+            users=args.users,
+            categories=args.categories,
+            genres=args.genres,
+            batch_size=args.batch_size,
+            random_seed=args.random_seed,
+        )
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Нагрузочный тест POST /api/v1/auth/signup/ через WSGI-сервер.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.signup_load --requests 400 --concurrency 8
+"""
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from benchmarks.utils import dump, serve_wsgi, setup_django, summarize, timed
+
+
+def post_json(url, data):
+    request = Request(
+        url,
+        data=json.dumps(data).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+    try:
+        with urlopen(request) as response:
+            return response.status
+    except HTTPError as error:
+        return error.code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--existing-users', type=int, default=1000)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    User = get_user_model()
+    User.objects.bulk_create(
+        User(username=f'existing{idx}', email=f'existing{idx}@yamdb.fake')
+        for idx in range(args.existing_users)
+    )
+    client = APIClient()
+    with CaptureQueriesContext(connection) as context:
+        client.post('/api/v1/auth/signup/', {
+            'username': 'probe', 'email': 'probe@yamdb.fake'
+        })
+    user_selects = sum(
+        query['sql'].startswith('SELECT')
+        and 'FROM "users_user"' in query['sql']
+        for query in context.captured_queries
+    )
+
+    payloads = []
+    for idx in range(args.requests):
+        if idx % 4 == 3:
+            payloads.append({
+                'username': f'existing{idx}',
+                'email': f'other{idx}@yamdb.fake',
+            })
+        else:
+            payloads.append({
+                'username': f'new{idx}', 'email': f'new{idx}@yamdb.fake'
+            })
+
+    with serve_wsgi() as base_url:
+        url = f'{base_url}/api/v1/auth/signup/'
+
+        def signup(payload):
+            return timed(post_json, url, payload)
+
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(signup, payloads))
+        wall = perf_counter() - started
+
+    statuses = {}
+    for _, status in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    latency = summarize([elapsed for elapsed, _ in results])
+    latency.pop('rps')
+    dump({
+        'signup': {
+            **latency,
+            'concurrency': args.concurrency,
+            'throughput_rps': round(len(results) / wall, 1),
+            'statuses': statuses,
+            'user_selects_per_signup': user_selects,
+        }
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from statistics import mean, quantiles
+from time import perf_counter, sleep
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PROJECT_DIR = BASE_DIR / 'api_yamdb'
+
+sys.path.insert(0, str(PROJECT_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+os.environ.setdefault('API_CACHE_SINGLE_PROCESS', '1')
+
+
+def setup_django(database=None):
+    import django
+    from django.conf import settings
+
+    if database is None:
+        database = Path(tempfile.mkdtemp()) / 'bench.sqlite3'
+    settings.DATABASES['default']['NAME'] = database
+    settings.DEBUG = False
+    django.setup()
+
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    settings.ALLOWED_HOSTS = ['*']
+    call_command('migrate', verbosity=0)
+    return database
+
+
+def summarize(timings):
+    timings = sorted(timings)
+    if len(timings) > 1:
+        percentiles = quantiles(timings, n=100, method='inclusive')
+        p50, p99 = percentiles[49], percentiles[98]
+    else:
+        p50 = p99 = timings[0]
+    total = sum(timings)
+    return {
+        'requests': len(timings),
+        'mean_ms': round(mean(timings) * 1000, 3),
+        'p50_ms': round(p50 * 1000, 3),
+        'p99_ms': round(p99 * 1000, 3),
+        'rps': round(len(timings) / total, 1) if total else None,
+    }
+
+
+def timed(func, *args, **kwargs):
+    started = perf_counter()
+    result = func(*args, **kwargs)
+    return perf_counter() - started, result
+
+
+def dump(results):
+    json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+
+
+@contextmanager
+def serve_wsgi():
+    from django.core.servers.basehttp import (
+        ThreadedWSGIServer,
+        WSGIRequestHandler,
+    )
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietHandler(WSGIRequestHandler):
+        def setup(self):
+            super().setup()
+            self.connection.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietHandler)
+    server.set_app(get_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def serve_asgi():
+    import uvicorn
+    from django.core.asgi import get_asgi_application
+
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    server = uvicorn.Server(uvicorn.Config(
+        get_asgi_application(), lifespan='off', log_level='warning'
+    ))
+    thread = threading.Thread(
+        target=server.run, kwargs={'sockets': [sock]}, daemon=True
+    )
+    thread.start()
+    while not server.started:
+        sleep(0.01)
+    try:
+        yield f'http://127.0.0.1:{sock.getsockname()[1]}'
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
@@ -0,0 +1,96 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from reviews.models import Review, Title
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08Rating:
+
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def check_rating(self, title_id, expected_sum, expected_count):
+        title = Title.objects.get(pk=title_id)
+        expected_rating = (
+            expected_sum / expected_count if expected_count else None
+        )
+        assert (
+            title.rating_sum, title.rating_count, title.rating
+        ) == (expected_sum, expected_count, expected_rating), (
+            'Проверьте, что сохранённый рейтинг произведения обновляется '
+            'при создании, изменении и удалении отзывов.'
+        )
+
+    def test_01_rating_follows_reviews(self, admin_client, admin, user_client,
+                                       user, moderator_client, moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        reviews, titles = create_reviews(admin_client, author_map)
+        title_id = titles[0]['id']
+        self.check_rating(title_id, 15, 3)
+        self.check_rating(titles[1]['id'], 0, 0)
+
+        admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+            data={'score': 9}
+        )
+        self.check_rating(title_id, 19, 3)
+
+        admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+            data={'text': 'only text'}
+        )
+        self.check_rating(title_id, 19, 3)
+
+        admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            )
+        )
+        self.check_rating(title_id, 14, 2)
+
+        Review.objects.filter(title_id=title_id).delete()
+        self.check_rating(title_id, 0, 0)
+
+    def test_02_rebuild_ratings(self, admin_client, admin, user_client, user):
+        author_map = {admin: admin_client, user: user_client}
+        _, titles = create_reviews(admin_client, author_map)
+        call_command('rebuild_ratings', '--check')
+
+        Title.objects.update(rating_sum=0, rating_count=0, rating=None)
+        with pytest.raises(CommandError):
+            call_command('rebuild_ratings', '--check')
+
+        call_command('rebuild_ratings')
+        call_command('rebuild_ratings', '--check')
+        self.check_rating(titles[0]['id'], 10, 2)
+
+    def test_03_deferred_review_saved(self, admin_client, admin, user_client,
+                                      user):
+        author_map = {admin: admin_client, user: user_client}
+        _, titles = create_reviews(admin_client, author_map)
+        title_id = titles[0]['id']
+        review = Review.objects.filter(title_id=title_id).only('text').first()
+        review.text = 'deferred'
+        review.save()
+        self.check_rating(title_id, 10, 2)
+
+        review = Review.objects.filter(title_id=title_id).only('text').first()
+        review.score = 1
+        review.save()
+        self.check_rating(title_id, 6, 2)
+        review.delete()
+        self.check_rating(title_id, 5, 1)
+
+        Review.objects.filter(title_id=title_id).only('text').first().delete()
+        self.check_rating(title_id, 0, 0)
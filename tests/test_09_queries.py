@@ -0,0 +1,101 @@
+import pytest
+
+from api.pagination import OptionalCursorPagination
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    Genre_Title,
+    Review,
+    Title,
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09Queries:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_QUERY_BUDGET = 3
+    NESTED_QUERY_BUDGET = 3
+
+    def create_titles(self, count):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genres = [
+            Genre.objects.create(name='Ужасы', slug='horror'),
+            Genre.objects.create(name='Драма', slug='drama'),
+        ]
+        Title.objects.bulk_create(
+            Title(name=f'Фильм {idx}', year=2000, category=category)
+            for idx in range(count)
+        )
+        titles = Title.objects.order_by('pk')
+        Genre_Title.objects.bulk_create(
+            Genre_Title(title_id=title, genre_id=genre)
+            for title in titles
+            for genre in genres
+        )
+
+    @pytest.mark.parametrize('limit', (5, 50, 100))
+    def test_01_titles_list_query_budget(self, client, limit,
+                                         django_assert_max_num_queries):
+        self.create_titles(100)
+        with django_assert_max_num_queries(self.TITLES_QUERY_BUDGET):
+            response = client.get(self.TITLES_URL, {'limit': limit})
+        results = response.json()['results']
+        assert len(results) == limit
+        assert all(len(title['genre']) == 2 for title in results), (
+            f'Проверьте, что ответ на GET-запрос к `{self.TITLES_URL}` '
+            'содержит жанры каждого произведения.'
+        )
+
+    def test_02_title_detail_query_budget(self, client,
+                                          django_assert_max_num_queries):
+        self.create_titles(1)
+        title = Title.objects.get()
+        with django_assert_max_num_queries(2):
+            response = client.get(f'{self.TITLES_URL}{title.pk}/')
+        assert response.json()['category'] == {
+            'name': 'Фильм', 'slug': 'films'
+        }
+
+    def create_reviews(self, django_user_model, count):
+        title = Title.objects.create(name='Фильм', year=2000)
+        django_user_model.objects.bulk_create(
+            django_user_model(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            for idx in range(count)
+        )
+        authors = django_user_model.objects.filter(
+            username__startswith='author'
+        )
+        Review.objects.bulk_create(
+            Review(title=title, author=author, text='Отзыв', score=5)
+            for author in authors
+        )
+        review = Review.objects.order_by('pk').first()
+        Comment.objects.bulk_create(
+            Comment(review_id=review, author=author, text='Комментарий')
+            for author in authors
+        )
+        return title, review
+
+    @pytest.mark.parametrize('page_size', (5, 50, 500))
+    def test_03_reviews_and_comments_query_budget(
+            self, client, page_size, monkeypatch, django_user_model,
+            django_assert_num_queries):
+        title, review = self.create_reviews(django_user_model, 500)
+        monkeypatch.setattr(OptionalCursorPagination, 'page_size', page_size)
+        reviews_url = f'{self.TITLES_URL}{title.pk}/reviews/'
+        comments_url = f'{reviews_url}{review.pk}/comments/'
+        for url in (reviews_url, comments_url):
+            with django_assert_num_queries(self.NESTED_QUERY_BUDGET):
+                response = client.get(url)
+            results = response.json()['results']
+            assert len(results) == page_size
+            assert all(
+                item['author'].startswith('author') for item in results
+            ), (
+                f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+                'имя автора каждой записи без отдельного запроса к базе.'
+            )
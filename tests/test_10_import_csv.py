@@ -0,0 +1,43 @@
+import csv
+import os
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from reviews.models import Category, Comment, Genre, Genre_Title, Review, Title
+
+DATA_DIR = os.path.join(settings.BASE_DIR, 'static', 'data')
+
+
+def count_rows(filename):
+    with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as file:
+        return sum(1 for _ in csv.DictReader(file))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10ImportCSV:
+
+    def test_01_import_static_data(self):
+        call_command('import_csv', batch_size=7)
+        expected = {
+            'users.csv': get_user_model(),
+            'category.csv': Category,
+            'genre.csv': Genre,
+            'titles.csv': Title,
+            'genre_title.csv': Genre_Title,
+            'review.csv': Review,
+            'comments.csv': Comment,
+        }
+        for filename, model in expected.items():
+            assert model.objects.count() == count_rows(filename), (
+                f'Проверьте, что команда `import_csv` загружает все строки '
+                f'из файла `{filename}`.'
+            )
+        review = Review.objects.get(pk=1)
+        expected_pub_date = '2019-09-24T21:08:21.567000+00:00'
+        assert review.pub_date.isoformat() == expected_pub_date, (
+            'Проверьте, что при загрузке сохраняется дата публикации отзыва.'
+        )
+        call_command('rebuild_ratings', '--check')
@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Comment, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11CursorPagination:
+
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def create_comments(self, user, count):
+        title = Title.objects.create(name='Фильм', year=2000)
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=5
+        )
+        Comment.objects.bulk_create(
+            Comment(review_id=review, author=user, text=f'Комментарий {idx}')
+            for idx in range(count)
+        )
+        pub_date = Comment.objects.first().pub_date
+        Comment.objects.filter(pk__gt=Comment.objects.first().pk + 5).update(
+            pub_date=pub_date
+        )
+        return self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.pk, review_id=review.pk
+        )
+
+    def test_01_cursor_walks_all_comments(self, client, user):
+        url = self.create_comments(user, 23)
+        expected_ids = list(
+            Comment.objects.order_by('pub_date', 'id')
+            .values_list('id', flat=True)
+        )
+
+        response = client.get(url, {'cursor': ''})
+        data = response.json()
+        assert 'count' not in data, (
+            'Проверьте, что в режиме курсорной пагинации не выполняется '
+            'подсчёт общего количества объектов.'
+        )
+        assert data['previous'] is None
+        pages = [data]
+        while data['next']:
+            data = client.get(data['next']).json()
+            pages.append(data)
+        ids = [item['id'] for page in pages for item in page['results']]
+        assert ids == expected_ids, (
+            'Проверьте, что курсорная пагинация возвращает все комментарии '
+            'по порядку и без повторов.'
+        )
+
+        back_ids = []
+        while data['previous']:
+            data = client.get(data['previous']).json()
+            back_ids = [item['id'] for item in data['results']] + back_ids
+        assert back_ids == expected_ids[:-len(pages[-1]['results'])]
+
+    def test_02_deep_page_costs_same_as_first(self, client, user):
+        url = self.create_comments(user, 40)
+        with CaptureQueriesContext(connection) as first_page:
+            data = client.get(url, {'cursor': ''}).json()
+        for _ in range(5):
+            data = client.get(data['next']).json()
+        with CaptureQueriesContext(connection) as deep_page:
+            client.get(data['next'])
+        assert len(deep_page) == len(first_page)
+        assert not any(
+            'COUNT(' in query['sql'] for query in deep_page.captured_queries
+        )
+
+    def test_03_invalid_cursor(self, client, user):
+        url = self.create_comments(user, 1)
+        response = client.get(url, {'cursor': 'garbage'})
+        assert response.status_code == 404
+
+    def test_04_page_number_by_default(self, client, user):
+        url = self.create_comments(user, 7)
+        data = client.get(url).json()
+        assert data['count'] == 7
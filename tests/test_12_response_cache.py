@@ -0,0 +1,146 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import transaction
+
+from api.cache import get_versions
+from api.checks import check_shared_caches
+from reviews.models import Genre, Title
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ResponseCache:
+
+    GENRES_URL = '/api/v1/genres/'
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_genres_cached_until_changed(self, client, admin_client,
+                                            django_assert_num_queries):
+        Genre.objects.create(name='Ужасы', slug='horror')
+        assert client.get(self.GENRES_URL).json()['count'] == 1
+        with django_assert_num_queries(0):
+            response = client.get(self.GENRES_URL)
+        assert response.json()['count'] == 1
+
+        admin_client.post(
+            self.GENRES_URL, data={'name': 'Драма', 'slug': 'drama'}
+        )
+        assert client.get(self.GENRES_URL).json()['count'] == 2, (
+            'Проверьте, что кэш списка жанров сбрасывается при добавлении '
+            'жанра.'
+        )
+        admin_client.delete(f'{self.GENRES_URL}drama/')
+        assert client.get(self.GENRES_URL).json()['count'] == 1
+
+    def test_02_query_params_normalized(self, client, admin_client,
+                                        django_assert_num_queries):
+        create_titles(admin_client)
+        client.get(self.TITLES_URL, {'limit': 1, 'offset': 1, 'name': ''})
+        with django_assert_num_queries(0):
+            response = client.get(f'{self.TITLES_URL}?offset=1&limit=1')
+        assert len(response.json()['results']) == 1
+        with django_assert_num_queries(0):
+            client.get(f'{self.TITLES_URL}?limit=1&offset=1&search=')
+
+    def test_03_titles_follow_reviews_and_genres(self, client, admin_client,
+                                                 user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_url = f'{self.TITLES_URL}{titles[0]["id"]}/'
+        assert client.get(title_url).json()['rating'] is None
+        list_before = client.get(self.TITLES_URL).json()
+
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 7)
+        assert client.get(title_url).json()['rating'] == 7, (
+            'Проверьте, что кэш произведения сбрасывается при изменении '
+            'его рейтинга.'
+        )
+        ratings = {
+            title['id']: title['rating']
+            for title in client.get(self.TITLES_URL).json()['results']
+        }
+        assert ratings[titles[0]['id']] == 7
+        assert list_before != client.get(self.TITLES_URL).json()
+
+        Genre.objects.filter(slug='horror').update(name='Хоррор')
+        Genre.objects.get(slug='horror').save()
+        genres = client.get(title_url).json()['genre']
+        assert {'name': 'Хоррор', 'slug': 'horror'} in genres
+
+        admin_client.patch(title_url, data={'genre': ['drama']})
+        assert client.get(title_url).json()['genre'] == [
+            {'name': 'Драма', 'slug': 'drama'}
+        ]
+        Title.objects.get(pk=titles[0]['id']).delete()
+        assert client.get(title_url).status_code == 404
+
+    def test_04_file_based_backend(self, client, settings, tmp_path,
+                                   django_assert_num_queries):
+        settings.CACHES = {
+            'default': settings.CACHES['default'],
+            'files': {
+                'BACKEND': (
+                    'django.core.cache.backends.filebased.FileBasedCache'
+                ),
+                'LOCATION': str(tmp_path),
+            },
+        }
+        settings.API_CACHE_ALIAS = 'files'
+        Genre.objects.create(name='Ужасы', slug='horror')
+        client.get(self.GENRES_URL)
+        with django_assert_num_queries(0):
+            assert client.get(self.GENRES_URL).json()['count'] == 1
+        Genre.objects.create(name='Драма', slug='drama')
+        assert client.get(self.GENRES_URL).json()['count'] == 2
+
+    def test_05_process_local_cache(self, client, settings,
+                                    django_assert_num_queries):
+        settings.API_CACHE_SINGLE_PROCESS = False
+        Genre.objects.create(name='Ужасы', slug='horror')
+        client.get(self.GENRES_URL)
+        with django_assert_num_queries(2):
+            client.get(self.GENRES_URL)
+        warnings = [
+            warning.id for warning in check_shared_caches(None)
+        ]
+        assert warnings == ['api.W001', 'api.W001'], (
+            'Проверьте, что локальный кэш процесса не используется для '
+            'ответов при нескольких воркерах и вызывает предупреждение.'
+        )
+
+    def test_06_cache_outage(self, client, admin_client, user,
+                             user_client, settings):
+        titles, _, _ = create_titles(admin_client)
+        settings.CACHES = {**settings.CACHES, 'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': '127.0.0.1:1',
+            'OPTIONS': {'ignore_exc': True},
+        }}
+        response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что при недоступном кэше API отвечает из базы.'
+        )
+        reviews_url = f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        response = client.get(reviews_url)
+        assert response.status_code == HTTPStatus.OK
+        assert not response.has_header('ETag'), (
+            'Проверьте, что без кэша версий ответ не получает ETag.'
+        )
+        assert user_client.get('/api/v1/users/me/').status_code == (
+            HTTPStatus.OK
+        )
+        response = admin_client.post(
+            self.GENRES_URL, data={'name': 'Мюзикл', 'slug': 'musical'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+    def test_07_bump_after_commit(self):
+        Genre.objects.create(name='Ужасы', slug='horror')
+        versions = get_versions(('genres',))
+        with transaction.atomic():
+            Genre.objects.create(name='Драма', slug='drama')
+            assert get_versions(('genres',)) == versions, (
+                'Проверьте, что версия кэша меняется только после фиксации '
+                'транзакции.'
+            )
+        assert get_versions(('genres',)) != versions
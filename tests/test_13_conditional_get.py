@@ -0,0 +1,127 @@
+from http import HTTPStatus
+from time import time
+
+import pytest
+
+from api import cache
+
+from tests.utils import (
+    create_comments, create_single_comment, create_single_review,
+    create_titles
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13ConditionalGet:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def assert_not_modified(self, client, url, etag,
+                            django_assert_num_queries):
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным ETag '
+            'возвращает ответ со статусом 304.'
+        )
+
+    def test_01_reviews_etag(self, client, admin_client, user_client,
+                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        review = create_single_review(admin_client, titles[0]['id'], 'a', 5)
+
+        response = client.get(url)
+        etag = response['ETag']
+        assert etag
+        self.assert_not_modified(client, url, etag, django_assert_num_queries)
+
+        create_single_review(user_client, titles[0]['id'], 'b', 3)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == 2
+        etag = response['ETag']
+
+        admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=review.json()['id']
+            ),
+            data={'text': 'new text'}
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag списка отзывов меняется при '
+            'редактировании отзыва.'
+        )
+        other_url = self.REVIEWS_URL_TEMPLATE.format(
+            title_id=titles[1]['id']
+        )
+        assert client.get(other_url)['ETag'] != response['ETag']
+        keyset = client.get(url, {'cursor': ''})
+        assert keyset['ETag'] != response['ETag'], (
+            'Проверьте, что ETag различается для постраничного и '
+            'курсорного режимов списка отзывов.'
+        )
+
+    def test_02_comments_etag(self, client, admin_client, admin, user_client,
+                              user, django_assert_num_queries):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[0]['id']
+        )
+        etag = client.get(url)['ETag']
+        self.assert_not_modified(client, url, etag, django_assert_num_queries)
+
+        create_single_comment(
+            user_client, titles[0]['id'], reviews[0]['id'], 'new'
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == len(comments) + 1
+
+    def test_03_titles_last_modified(self, client, admin_client,
+                                     monkeypatch, django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get(self.TITLES_URL)
+        assert not response.has_header('Last-Modified'), (
+            'Проверьте, что `Last-Modified` не отдаётся, пока в текущей '
+            'секунде возможны новые изменения.'
+        )
+        assert 'json' not in response['ETag']
+
+        monkeypatch.setattr(cache, 'time', lambda: time() + 2)
+        response = client.get(self.TITLES_URL)
+        last_modified = response['Last-Modified']
+        with django_assert_num_queries(0):
+            response = client.get(
+                self.TITLES_URL, HTTP_IF_MODIFIED_SINCE=last_modified
+            )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/'
+        etag = client.get(url)['ETag']
+        self.assert_not_modified(client, url, etag, django_assert_num_queries)
+        admin_client.patch(url, data={'name': 'Новое название'})
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+            HTTPStatus.OK
+        )
+
+    def test_04_process_local_cache(self, client, admin_client, settings):
+        titles, _, _ = create_titles(admin_client)
+        settings.API_CACHE_SINGLE_PROCESS = False
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert not response.has_header('ETag'), (
+            'Проверьте, что условные GET-запросы отключены, если кэш '
+            'версий локален для процесса.'
+        )
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14NestedParents:
+
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_review_must_belong_to_title(self, admin_client, admin):
+        _, reviews, titles = create_comments(
+            admin_client, {admin: admin_client}
+        )
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[1]['id'], review_id=reviews[0]['id']
+        )
+        assert admin_client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что GET-запрос к комментариям отзыва, который не '
+            'относится к произведению из адреса, возвращает ответ со '
+            'статусом 404.'
+        )
+        response = admin_client.post(url, data={'text': 'Комментарий'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_parent_fetched_once(self, admin_client, admin):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client}
+        )
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[0]['id']
+        )
+        requests = (
+            ('post', url, {'text': 'Комментарий'}),
+            ('get', url, None),
+            ('patch', f'{url}{comments[0]["id"]}/', {'text': 'Новый'}),
+            ('delete', f'{url}{comments[0]["id"]}/', None),
+        )
+        for method, request_url, data in requests:
+            with CaptureQueriesContext(connection) as context:
+                response = getattr(admin_client, method)(request_url, data)
+            assert response.status_code < 300
+            parent_queries = [
+                query for query in context.captured_queries
+                if query['sql'].startswith('SELECT')
+                and 'FROM "reviews_review"' in query['sql']
+            ]
+            assert len(parent_queries) == 1, (
+                'Проверьте, что отзыв и произведение загружаются одним '
+                f'запросом при {method.upper()}-запросе к `{request_url}`.'
+            )
+            assert 'reviews_title' in parent_queries[0]['sql']
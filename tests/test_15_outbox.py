@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from users.models import OutboxEmail
+from users.outbox import claim_batch
+
+
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionError('SMTP недоступен')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15Outbox:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def signup(self, client, count=1):
+        for idx in range(count):
+            response = client.post(self.URL_SIGNUP, data={
+                'email': f'user{idx}@yamdb.fake', 'username': f'user{idx}'
+            })
+            assert response.status_code == 200
+
+    def test_01_signup_enqueues_email(self, client):
+        outbox_before = len(mail.outbox)
+        self.signup(client)
+        assert len(mail.outbox) == outbox_before, (
+            'Проверьте, что при регистрации письмо ставится в очередь, '
+            'а не отправляется во время запроса.'
+        )
+        email = OutboxEmail.objects.get()
+        assert email.status == OutboxEmail.Status.PENDING
+        assert email.recipient == 'user0@yamdb.fake'
+
+    def test_02_worker_sends_batches(self, client):
+        self.signup(client, 7)
+        outbox_before = len(mail.outbox)
+        call_command('send_outbox', batch_size=3, workers=2)
+        assert len(mail.outbox) == outbox_before + 7
+        assert not OutboxEmail.objects.exclude(
+            status=OutboxEmail.Status.SENT
+        ).exists()
+        call_command('send_outbox')
+        assert len(mail.outbox) == outbox_before + 7
+
+    def test_03_retry_with_backoff(self, client, settings):
+        settings.EMAIL_BACKEND = 'tests.test_15_outbox.FailingBackend'
+        self.signup(client)
+        call_command('send_outbox', backoff=60, max_attempts=2)
+        email = OutboxEmail.objects.get()
+        assert email.status == OutboxEmail.Status.PENDING
+        assert email.attempts == 1
+        assert 'SMTP' in email.last_error
+        assert email.next_attempt_at > timezone.now() + timedelta(seconds=50)
+
+        call_command('send_outbox', backoff=60, max_attempts=2)
+        assert OutboxEmail.objects.get().attempts == 1, (
+            'Проверьте, что письмо не отправляется повторно раньше срока.'
+        )
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        call_command('send_outbox', backoff=60, max_attempts=2)
+        email = OutboxEmail.objects.get()
+        assert email.status == OutboxEmail.Status.FAILED
+        assert email.attempts == 2
+
+    def test_04_file_backend(self, client, settings, tmp_path):
+        settings.EMAIL_BACKEND = (
+            'django.core.mail.backends.filebased.EmailBackend'
+        )
+        settings.EMAIL_FILE_PATH = tmp_path
+        self.signup(client, 3)
+        call_command('send_outbox', workers=1)
+        sent = ''.join(path.read_text() for path in tmp_path.iterdir())
+        assert all(
+            f'user{idx}@yamdb.fake' in sent for idx in range(3)
+        )
+        assert OutboxEmail.objects.filter(
+            status=OutboxEmail.Status.SENT, attempts=1
+        ).count() == 3
+
+    def test_05_concurrent_claims(self, client, monkeypatch):
+        self.signup(client, 3)
+        update = QuerySet.update
+        claimed = []
+
+        def racing_update(queryset, **kwargs):
+            monkeypatch.setattr(QuerySet, 'update', update)
+            claimed.extend(claim_batch(10))
+            return update(queryset, **kwargs)
+
+        monkeypatch.setattr(QuerySet, 'update', racing_update)
+        assert claim_batch(10) == [], (
+            'Проверьте, что письма, которые успел забрать другой '
+            'обработчик, не выдаются повторно.'
+        )
+        assert len(claimed) == 3
@@ -0,0 +1,60 @@
+import pytest
+from django.db import connection
+
+from reviews.models import Title
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16TitleFilters:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def names(self, client, **params):
+        response = client.get(self.TITLES_URL, params)
+        return {title['name'] for title in response.json()['results']}
+
+    def test_01_exact_slug_filters(self, client, admin_client):
+        create_titles(admin_client)
+        assert self.names(client, category_slug='films') == {'Терминатор'}
+        assert self.names(client, category_slug='film') == set(), (
+            'Проверьте, что фильтр `category_slug` ищет точное совпадение.'
+        )
+        assert self.names(client, genre_slug='drama') == {'Крепкий орешек'}
+        assert self.names(client, genre_slug='dram') == set()
+        assert self.names(client, category='film') == {'Терминатор'}
+
+    def test_02_name_prefix(self, client, admin_client):
+        create_titles(admin_client)
+        assert self.names(client, name_prefix='креп') == {'Крепкий орешек'}
+        assert self.names(client, name_prefix='  КРЕПКИЙ  ОР') == {
+            'Крепкий орешек'
+        }, (
+            'Проверьте, что фильтр `name_prefix` не зависит от регистра '
+            'и лишних пробелов.'
+        )
+        assert self.names(client, name_prefix='орешек') == set()
+
+        title = Title.objects.get(name='Терминатор')
+        title.name = 'Терминатор 2'
+        title.save(update_fields=['name'])
+        assert Title.objects.get(pk=title.pk).name_normalized == (
+            'терминатор 2'
+        )
+
+    @pytest.mark.skipif(
+        connection.vendor != 'sqlite', reason='EXPLAIN QUERY PLAN из SQLite'
+    )
+    def test_03_filters_use_indexes(self):
+        queries = (
+            Title.objects.filter(
+                name_normalized__gte='кр', name_normalized__lt='кр\U0010ffff'
+            ),
+            Title.objects.filter(category_id=1, year=1988),
+        )
+        for queryset in queries:
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                plan = ' '.join(str(row) for row in cursor.fetchall())
+            assert 'USING INDEX' in plan, plan
@@ -0,0 +1,81 @@
+import pytest
+
+from reviews.models import Title
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17Search:
+
+    SEARCH_URL = '/api/v1/search/'
+
+    def search(self, client, query, **params):
+        response = client.get(self.SEARCH_URL, {'q': query, **params})
+        assert response.status_code == 200
+        return response.json()
+
+    def test_01_search_titles_reviews_comments(self, client, admin_client,
+                                               admin, user_client, user):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        data = self.search(client, 'орешек')
+        assert [(item['type'], item['id']) for item in data['results']] == [
+            ('title', titles[1]['id'])
+        ], (
+            f'Проверьте, что `{self.SEARCH_URL}` ищет по названиям '
+            'произведений.'
+        )
+        assert '[орешек]' in data['results'][0]['snippet']
+
+        data = self.search(client, 'review number')
+        assert data['count'] == len(reviews)
+        assert {item['type'] for item in data['results']} == {'review'}
+        assert all(
+            item['title_id'] == titles[0]['id'] for item in data['results']
+        )
+
+        data = self.search(client, 'comment', type='comment')
+        assert data['count'] == len(comments)
+        assert data['results'][0]['review_id'] == reviews[0]['id']
+
+        assert self.search(client, 'numb')['count'] == (
+            len(reviews) + len(comments)
+        ), 'Проверьте, что последнее слово запроса ищется по префиксу.'
+
+    def test_02_index_follows_changes(self, client):
+        title = Title.objects.create(name='Солярис', year=1972)
+        assert self.search(client, 'солярис')['count'] == 1
+        title.name = 'Сталкер'
+        title.save()
+        assert self.search(client, 'солярис')['count'] == 0
+        assert self.search(client, 'сталкер')['count'] == 1
+        title.delete()
+        assert self.search(client, 'сталкер')['count'] == 0
+
+    def test_03_ranking_and_pagination(self, client):
+        dune = Title.objects.create(
+            name='Дюна', year=1965, description='Пустыня, пустыня, пустыня'
+        )
+        Title.objects.create(
+            name='Марсианин', year=2011, description='Одна пустыня'
+        )
+        for idx in range(6):
+            Title.objects.create(
+                name=f'Книга {idx}', year=2000,
+                description='Большая пустыня и длинный текст про людей'
+            )
+        data = self.search(client, 'пустыня')
+        assert data['count'] == 8
+        assert len(data['results']) == 5
+        assert data['results'][0]['id'] == dune.pk, (
+            'Проверьте, что результаты поиска упорядочены по релевантности.'
+        )
+        second_page = client.get(data['next']).json()
+        ids = {item['id'] for item in data['results']}
+        assert ids.isdisjoint(item['id'] for item in second_page['results'])
+
+    def test_04_query_syntax_is_escaped(self, client):
+        Title.objects.create(name='Дюна', year=1965)
+        for query in ('"', 'AND OR', 'дюна NEAR(', '*', ''):
+            self.search(client, query)
@@ -0,0 +1,108 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from reviews.models import TitleScore
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18TitleStats:
+
+    STATS_URL_TEMPLATE = '/api/v1/titles/{title_id}/stats/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_stats(self, client, title_id):
+        response = client.get(
+            self.STATS_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос к `/api/v1/titles/{title_id}/stats/` '
+            'возвращает ответ со статусом 200.'
+        )
+        return response.json()
+
+    def test_01_stats_follow_reviews(self, client, admin_client, admin,
+                                     user_client, user, moderator_client,
+                                     moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        reviews, titles = create_reviews(admin_client, author_map)
+        title_id = titles[0]['id']
+
+        stats = self.get_stats(client, title_id)
+        assert stats['count'] == 3
+        assert stats['mean'] == 5
+        assert stats['median'] == 5
+        assert set(stats['histogram']) == {str(i) for i in range(1, 11)}, (
+            'Проверьте, что гистограмма содержит все оценки от 1 до 10.'
+        )
+        assert stats['histogram']['5'] == 3
+
+        admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+            data={'score': 9}
+        )
+        admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            ),
+            data={'score': 1}
+        )
+        stats = self.get_stats(client, title_id)
+        assert (stats['count'], stats['median']) == (3, 5), (
+            'Проверьте, что медиана пересчитывается при изменении оценок.'
+        )
+        assert (
+            stats['histogram']['1'],
+            stats['histogram']['5'],
+            stats['histogram']['9'],
+        ) == (1, 1, 1)
+
+        admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[2]['id']
+            )
+        )
+        stats = self.get_stats(client, title_id)
+        assert (stats['count'], stats['mean'], stats['median']) == (2, 5, 5)
+        assert stats['histogram']['5'] == 0, (
+            'Проверьте, что распределение оценок обновляется при удалении '
+            'отзыва.'
+        )
+
+        empty = self.get_stats(client, titles[1]['id'])
+        assert (empty['count'], empty['mean'], empty['median']) == (
+            0, None, None
+        )
+        assert sum(empty['histogram'].values()) == 0
+
+    def test_02_stats_not_found(self, client):
+        response = client.get(self.STATS_URL_TEMPLATE.format(title_id=999))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что статистика несуществующего произведения '
+            'возвращает ответ со статусом 404.'
+        )
+
+    def test_03_rebuild_scores(self, admin_client, admin, user_client, user):
+        author_map = {admin: admin_client, user: user_client}
+        _, titles = create_reviews(admin_client, author_map)
+        call_command('rebuild_ratings', '--check')
+
+        TitleScore.objects.all().delete()
+        with pytest.raises(CommandError):
+            call_command('rebuild_ratings', '--check')
+
+        call_command('rebuild_ratings')
+        call_command('rebuild_ratings', '--check')
+        assert TitleScore.objects.get(
+            title_id=titles[0]['id'], score=5
+        ).count == 2
@@ -0,0 +1,111 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from reviews.models import Review, TitleRanking
+from tests.utils import create_reviews, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19Leaderboard:
+
+    TOP_URL = '/api/v1/titles/top/'
+    TRENDING_URL = '/api/v1/titles/trending/'
+
+    def get_ids(self, client, url, params=None):
+        response = client.get(url, params or {})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        return [title['id'] for title in response.json()['results']]
+
+    def create_leaderboard(self, admin_client, admin, user_client, user,
+                           moderator_client, moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        _, titles = create_reviews(admin_client, author_map)
+        create_single_review(admin_client, titles[1]['id'], 'best', 10)
+        return titles
+
+    def test_01_top_uses_weighted_rating(self, client, admin_client, admin,
+                                         user_client, user, moderator_client,
+                                         moderator):
+        titles = self.create_leaderboard(
+            admin_client, admin, user_client, user, moderator_client,
+            moderator
+        )
+        assert self.get_ids(client, self.TOP_URL) == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            'Проверьте, что `/api/v1/titles/top/` упорядочивает произведения '
+            'по взвешенному рейтингу.'
+        )
+        ranking = TitleRanking.objects.get(title_id=titles[0]['id'])
+        assert ranking.weighted_rating == pytest.approx((15 + 3 * 5.5) / 6)
+
+        response = client.get(self.TOP_URL)
+        first = response.json()['results'][0]
+        assert first['recent_reviews'] == 1
+        assert first['weighted_rating'] == pytest.approx((10 + 3 * 5.5) / 4)
+
+    def test_02_trending_uses_recent_reviews(self, client, admin_client,
+                                             admin, user_client, user,
+                                             moderator_client, moderator):
+        titles = self.create_leaderboard(
+            admin_client, admin, user_client, user, moderator_client,
+            moderator
+        )
+        assert self.get_ids(client, self.TRENDING_URL) == [
+            titles[0]['id'], titles[1]['id']
+        ], (
+            'Проверьте, что `/api/v1/titles/trending/` упорядочивает '
+            'произведения по числу недавних отзывов.'
+        )
+
+        Review.objects.filter(title_id=titles[0]['id']).update(
+            pub_date=timezone.now() - timedelta(days=30)
+        )
+        call_command('refresh_rankings')
+        assert self.get_ids(client, self.TRENDING_URL) == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            'Проверьте, что команда `refresh_rankings` пересчитывает число '
+            'недавних отзывов.'
+        )
+
+    def test_03_leaderboard_filters(self, client, admin_client, admin,
+                                    user_client, user, moderator_client,
+                                    moderator):
+        titles = self.create_leaderboard(
+            admin_client, admin, user_client, user, moderator_client,
+            moderator
+        )
+        category = titles[0]['category']
+        assert self.get_ids(
+            client, self.TOP_URL, {'category': category}
+        ) == [titles[0]['id']], (
+            'Проверьте, что рейтинг можно отфильтровать по категории.'
+        )
+        genre = titles[1]['genre'][0]
+        assert self.get_ids(
+            client, self.TRENDING_URL, {'genre': genre}
+        ) == [titles[1]['id']], (
+            'Проверьте, что рейтинг можно отфильтровать по жанру.'
+        )
+
+        admin_client.patch(
+            f'/api/v1/titles/{titles[1]["id"]}/', data={'category': category}
+        )
+        assert self.get_ids(
+            client, self.TOP_URL, {'category': category}
+        ) == [titles[1]['id'], titles[0]['id']], (
+            'Проверьте, что смена категории произведения обновляет рейтинг '
+            'по категориям.'
+        )
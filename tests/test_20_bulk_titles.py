@@ -0,0 +1,145 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Genre_Title, Title, TitleRanking
+from tests.utils import create_categories, create_genre, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20BulkTitles:
+
+    BULK_URL = '/api/v1/titles/bulk/'
+
+    def test_01_bulk_create(self, admin_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        data = [
+            {
+                'name': f'Произведение {idx}',
+                'year': 2000 + idx,
+                'genre': [genres[0]['slug'], genres[1]['slug']],
+                'category': categories[idx % 2]['slug'],
+            }
+            for idx in range(10)
+        ]
+        response = admin_client.post(
+            self.BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что POST-запрос администратора к '
+            '`/api/v1/titles/bulk/` с корректными данными возвращает ответ '
+            'со статусом 201.'
+        )
+        result = response.json()
+        assert [title['name'] for title in result] == [
+            item['name'] for item in data
+        ]
+        assert sorted(
+            genre['slug'] for genre in result[0]['genre']
+        ) == sorted((genres[0]['slug'], genres[1]['slug']))
+        assert result[1]['category'] == categories[1]
+        assert Title.objects.count() == 10
+        assert TitleRanking.objects.count() == 10, (
+            'Проверьте, что для созданных произведений появляются позиции в '
+            'рейтинге.'
+        )
+        title = Title.objects.get(pk=result[3]['id'])
+        assert title.name_normalized == 'произведение 3'
+        assert title.genre.count() == 2
+
+    def test_02_bulk_ndjson_update(self, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        body = '\n'.join(
+            json.dumps(item) for item in (
+                {'id': titles[0]['id'], 'name': 'Терминатор 2',
+                 'genre': [genres[2]['slug']]},
+                {'name': 'Чужой', 'year': 1979, 'genre': [],
+                 'category': categories[1]['slug']},
+            )
+        )
+        response = admin_client.post(
+            self.BULK_URL, data=body, content_type='application/x-ndjson'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что `/api/v1/titles/bulk/` принимает NDJSON.'
+        )
+        updated, created = response.json()
+        assert updated['id'] == titles[0]['id']
+        assert updated['name'] == 'Терминатор 2'
+        assert updated['year'] == titles[0]['year']
+        assert [genre['slug'] for genre in updated['genre']] == [
+            genres[2]['slug']
+        ], 'Проверьте, что жанры обновлённого произведения заменяются.'
+        assert created['name'] == 'Чужой'
+        assert Title.objects.count() == 3
+
+    def test_03_bulk_errors(self, admin_client, user_client):
+        titles, categories, genres = create_titles(admin_client)
+        data = [
+            {'name': 'Хорошее', 'year': 2000, 'genre': [genres[0]['slug']],
+             'category': categories[0]['slug']},
+            {'name': 'Плохое', 'year': 3000, 'genre': ['missing'],
+             'category': 'missing'},
+            {'id': 999, 'name': 'Нет такого'},
+        ]
+        response = admin_client.post(
+            self.BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()['errors']
+        assert errors[0] == {}, (
+            'Проверьте, что ошибки возвращаются для каждого элемента списка.'
+        )
+        assert set(errors[1]) == {'year', 'genre', 'category'}, (
+            'Проверьте, что несуществующие жанры и категории сообщаются и '
+            'для элементов с ошибками в других полях.'
+        )
+        assert set(errors[2]) == {'id'}
+        assert Title.objects.count() == 2, (
+            'Проверьте, что при ошибках ни одно произведение не сохраняется.'
+        )
+
+        data[1]['year'] = 2000
+        response = admin_client.post(
+            self.BULK_URL, data=data[:2], format='json'
+        )
+        errors = response.json()['errors']
+        assert set(errors[1]) == {'genre', 'category'}
+
+        response = admin_client.post(
+            self.BULK_URL, data={'name': 'x'}, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        response = user_client.post(
+            self.BULK_URL, data=data[:1], format='json'
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что массовая загрузка доступна только администратору.'
+        )
+
+    def test_04_bulk_duplicates_and_updates(self, admin_client):
+        titles, _, genres = create_titles(admin_client)
+        title_id = titles[0]['id']
+        data = [
+            {'id': title_id, 'genre': [genres[0]['slug'], genres[1]['slug']]},
+            {'id': title_id, 'genre': [genres[0]['slug']]},
+        ]
+        response = admin_client.post(
+            self.BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json()['errors'] == [
+            {}, {'id': ['Произведение уже встречается в этом запросе.']}
+        ], 'Проверьте, что повторяющиеся id в одном запросе отклоняются.'
+
+        response = admin_client.post(
+            self.BULK_URL, data=data[:1], format='json'
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что запрос, только обновляющий произведения, '
+            'возвращает ответ со статусом 200.'
+        )
+        assert Genre_Title.objects.filter(title_id=title_id).count() == 2
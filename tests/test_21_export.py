@@ -0,0 +1,107 @@
+import csv
+import json
+import re
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Comment, Review
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21Export:
+
+    EXPORT_URL_TEMPLATE = '/api/v1/export/{dataset}.{fmt}'
+    PUB_DATE_PATTERN = r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z'
+
+    def create_data(self, admin_client, admin, user_client, user):
+        author_map = {admin: admin_client, user: user_client}
+        return create_comments(admin_client, author_map)
+
+    def get_content(self, client, dataset, fmt):
+        response = client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset=dataset, fmt=fmt)
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что администратор может получить выгрузку '
+            f'`/api/v1/export/{dataset}.{fmt}`.'
+        )
+        assert response.streaming, (
+            'Проверьте, что выгрузка отдаётся потоком.'
+        )
+        return b''.join(response.streaming_content).decode()
+
+    def test_01_export_csv(self, admin_client, admin, user_client, user):
+        _, reviews, titles = self.create_data(
+            admin_client, admin, user_client, user
+        )
+        rows = list(csv.DictReader(
+            self.get_content(admin_client, 'titles', 'csv').splitlines()
+        ))
+        assert [row['name'] for row in rows] == [
+            title['name'] for title in titles
+        ]
+        assert list(rows[0])[:4] == ['id', 'name', 'year', 'category'], (
+            'Проверьте, что CSV-выгрузка повторяет формат `static/data`.'
+        )
+
+        rows = list(csv.DictReader(
+            self.get_content(admin_client, 'reviews', 'csv').splitlines()
+        ))
+        assert list(rows[0]) == [
+            'id', 'title_id', 'text', 'author', 'score', 'pub_date'
+        ]
+        assert len(rows) == len(reviews)
+        assert rows[0]['author'] == str(admin.pk)
+        assert re.fullmatch(self.PUB_DATE_PATTERN, rows[0]['pub_date'])
+
+    def test_02_export_ndjson(self, admin_client, admin, user_client, user):
+        comments, _, _ = self.create_data(
+            admin_client, admin, user_client, user
+        )
+        lines = self.get_content(
+            admin_client, 'comments', 'ndjson'
+        ).splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [row['text'] for row in rows] == [
+            comment['text'] for comment in comments
+        ]
+        assert set(rows[0]) == {
+            'id', 'review_id', 'text', 'author', 'pub_date'
+        }
+        assert re.fullmatch(self.PUB_DATE_PATTERN, rows[0]['pub_date'])
+
+    def test_03_export_permissions(self, client, user_client, admin_client):
+        url = self.EXPORT_URL_TEMPLATE.format(dataset='titles', fmt='csv')
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что выгрузка доступна только администратору.'
+        )
+        response = admin_client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset='users', fmt='csv')
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = admin_client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset='titles', fmt='xml')
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_export_command(self, admin_client, admin, user_client, user,
+                               tmp_path):
+        self.create_data(admin_client, admin, user_client, user)
+        call_command('export', '--path', str(tmp_path), '--chunk-size', '1')
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'category.csv', 'comments.csv', 'genre.csv', 'genre_title.csv',
+            'review.csv', 'titles.csv',
+        ], 'Проверьте, что команда `export` создаёт файлы как в `static/data`.'
+        with open(tmp_path / 'review.csv', encoding='utf-8') as file:
+            assert len(list(csv.DictReader(file))) == Review.objects.count()
+
+        call_command(
+            'export', '--path', str(tmp_path), '--format', 'ndjson',
+            '--dataset', 'comments',
+        )
+        with open(tmp_path / 'comments.ndjson', encoding='utf-8') as file:
+            assert len(file.readlines()) == Comment.objects.count()
@@ -0,0 +1,85 @@
+import re
+from http import HTTPStatus
+
+import pytest
+
+from api import metrics
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22Metrics:
+
+    METRICS_URL = '/api/v1/metrics/'
+    SERVER_TIMING_PATTERN = (
+        r'db;dur=[\d.]+;desc="(\d+) queries", '
+        r'serializer;dur=[\d.]+, total;dur=[\d.]+'
+    )
+
+    def test_01_server_timing_header(self, client, admin_client,
+                                     django_assert_num_queries):
+        create_titles(admin_client)
+        with django_assert_num_queries(3):
+            response = client.get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        match = re.fullmatch(
+            self.SERVER_TIMING_PATTERN, response.get('Server-Timing', '')
+        )
+        assert match, (
+            'Проверьте, что ответ содержит заголовок `Server-Timing` с '
+            'временем SQL, сериализации и обработки запроса.'
+        )
+        assert match.group(1) == '3', (
+            'Проверьте, что в `Server-Timing` указано число SQL-запросов.'
+        )
+
+    def test_02_metrics_endpoint(self, client, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        metrics.reset()
+        client.get('/api/v1/titles/')
+        client.get('/api/v1/titles/')
+        create_single_review(user_client, titles[0]['id'], 'review', 7)
+        client.get('/api/v1/titles/999/')
+
+        response = admin_client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert set(data) >= {
+            'TitleViewSet.list',
+            'TitleViewSet.retrieve',
+            'ReviewViewSet.create',
+        }, (
+            'Проверьте, что метрики группируются по классу представления и '
+            'действию.'
+        )
+        titles_list = data['TitleViewSet.list']
+        assert titles_list['requests'] == 2
+        assert titles_list['statuses'] == {'200': 2}
+        assert titles_list['queries']['count'] == 2
+        assert sum(titles_list['total_ms']['buckets'].values()) == 2
+        assert titles_list['serializer_ms']['count'] == 2
+        assert data['TitleViewSet.retrieve']['statuses'] == {'404': 1}
+        assert data['ReviewViewSet.create']['statuses'] == {'201': 1}
+
+    def test_03_metrics_permissions(self, client, user_client):
+        assert client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        ), 'Проверьте, что метрики доступны только администратору.'
+
+    def test_04_streaming_response(self, admin_client):
+        create_titles(admin_client)
+        metrics.reset()
+        response = admin_client.get('/api/v1/export/titles.csv')
+        assert response.streaming
+        assert not response.has_header('Server-Timing')
+        assert 'ExportView.get' not in metrics.snapshot()
+        b''.join(response.streaming_content)
+        export = metrics.snapshot()['ExportView.get']
+        assert export['requests'] == 1
+        assert export['queries']['sum'] >= 1, (
+            'Проверьте, что запросы к базе во время выгрузки попадают в '
+            'метрики потокового ответа.'
+        )
@@ -0,0 +1,94 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from rest_framework.test import APIClient
+
+from tests.utils import create_single_review, create_titles
+from users.tokens import UserAccessToken
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23StatelessJWT:
+
+    TOKEN_URL = '/api/v1/auth/token/'
+    METRICS_URL = '/api/v1/metrics/'
+
+    def get_client(self, user):
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {UserAccessToken.for_user(user)}'
+        )
+        return client
+
+    def test_01_token_contains_claims(self, client, admin):
+        response = client.post(self.TOKEN_URL, data={
+            'username': admin.username,
+            'confirmation_code': default_token_generator.make_token(admin),
+        })
+        assert response.status_code == HTTPStatus.OK
+        token = UserAccessToken(response.json()['token'])
+        assert (
+            token['username'], token['role'], token['is_superuser'],
+            token['ver'],
+        ) == (admin.username, 'admin', False, admin.auth_version), (
+            'Проверьте, что токен содержит `username`, `role`, '
+            '`is_superuser` и версию авторизации пользователя.'
+        )
+
+    def test_02_no_user_query(self, admin, django_assert_num_queries):
+        client = self.get_client(admin)
+        assert client.get(self.METRICS_URL).status_code == HTTPStatus.OK
+        with django_assert_num_queries(0):
+            response = client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что права администратора определяются по токену '
+            'без запроса к таблице пользователей.'
+        )
+
+    def test_03_role_change_revokes_token(self, admin):
+        client = self.get_client(admin)
+        assert client.get(self.METRICS_URL).status_code == HTTPStatus.OK
+
+        admin.role = 'user'
+        admin.save()
+        assert client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), 'Проверьте, что после смены роли старый токен отклоняется.'
+        assert self.get_client(admin).get(self.METRICS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+        admin.bio = 'new bio'
+        admin.save()
+        client = self.get_client(admin)
+        admin.save()
+        assert client.get('/api/v1/users/me/').status_code == HTTPStatus.OK
+
+        admin.revoke_tokens()
+        assert client.get('/api/v1/users/me/').status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), 'Проверьте, что `revoke_tokens` отзывает выданные токены.'
+
+    def test_04_claims_user_writes(self, admin_client, user, moderator):
+        titles, _, _ = create_titles(admin_client)
+        client = self.get_client(user)
+        response = create_single_review(client, titles[0]['id'], 'text', 5)
+        review = response.json()
+        assert review['author'] == user.username
+
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+        response = client.patch(url, data={'text': 'new text'})
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что автор с токеном без запроса к базе может '
+            'редактировать свой отзыв.'
+        )
+        response = self.get_client(moderator).patch(url, data={'score': 1})
+        assert response.status_code == HTTPStatus.OK
+
+        response = client.post(f'{url}comments/', data={'text': 'comment'})
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.json()['author'] == user.username
+
+        response = client.get('/api/v1/users/me/')
+        assert response.json()['email'] == user.email
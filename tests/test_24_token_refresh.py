@@ -0,0 +1,94 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.backends import TokenBackend
+
+from users.authentication import verified_tokens
+from users.tokens import UserAccessToken
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24TokenRefresh:
+
+    TOKEN_URL = '/api/v1/auth/token/'
+    REFRESH_URL = '/api/v1/auth/token/refresh/'
+
+    def get_tokens(self, client, user):
+        response = client.post(self.TOKEN_URL, data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        assert response.status_code == HTTPStatus.OK
+        return response.json()
+
+    def test_01_refresh_flow(self, client, user):
+        tokens = self.get_tokens(client, user)
+        assert set(tokens) == {'token', 'refresh'}, (
+            'Проверьте, что `/api/v1/auth/token/` возвращает access- и '
+            'refresh-токены.'
+        )
+        access = UserAccessToken(tokens['token'])
+        assert timedelta(seconds=access['exp'] - access['iat']) == (
+            timedelta(minutes=15)
+        ), 'Проверьте, что access-токен живёт 15 минут.'
+
+        user.bio = 'new bio'
+        user.save()
+        response = client.post(
+            self.REFRESH_URL, data={'refresh': tokens['refresh']}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что `/api/v1/auth/token/refresh/` выдаёт новый '
+            'access-токен по refresh-токену.'
+        )
+        refreshed = UserAccessToken(response.json()['token'])
+        assert refreshed['username'] == user.username
+        assert refreshed['ver'] == user.auth_version
+
+    def test_02_refresh_rejected(self, client, user):
+        tokens = self.get_tokens(client, user)
+        response = client.post(
+            self.REFRESH_URL, data={'refresh': tokens['token']}
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что access-токен нельзя использовать для обновления.'
+        )
+        response = client.post(self.REFRESH_URL, data={'refresh': 'broken'})
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        response = client.post(self.REFRESH_URL, data={})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        user.role = 'moderator'
+        user.save()
+        response = client.post(
+            self.REFRESH_URL, data={'refresh': tokens['refresh']}
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что после смены роли refresh-токен отклоняется.'
+        )
+
+    def test_03_verified_token_cache(self, user, monkeypatch):
+        decoded = []
+        decode = TokenBackend.decode
+
+        def counting_decode(self, *args, **kwargs):
+            decoded.append(args)
+            return decode(self, *args, **kwargs)
+
+        monkeypatch.setattr(TokenBackend, 'decode', counting_decode)
+        verified_tokens.clear()
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {UserAccessToken.for_user(user)}'
+        )
+        for _ in range(3):
+            assert client.get('/api/v1/users/me/').status_code == (
+                HTTPStatus.OK
+            )
+        assert len(decoded) == 1, (
+            'Проверьте, что подпись одного и того же токена проверяется '
+            'только один раз.'
+        )
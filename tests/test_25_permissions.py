@@ -0,0 +1,75 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from api.permissions import IsAuthorOrStaff
+from reviews.models import Review
+from tests.utils import create_single_review, create_titles
+from users.authentication import ClaimsUser
+from users.tokens import UserAccessToken
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Permissions:
+
+    def get_client(self, user):
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {UserAccessToken.for_user(user)}'
+        )
+        return client
+
+    def test_01_author_or_staff(self, admin_client, user, moderator, admin,
+                                user_superuser, django_user_model):
+        titles, _, _ = create_titles(admin_client)
+        author_client = self.get_client(user)
+        review = create_single_review(
+            author_client, titles[0]['id'], 'text', 5
+        ).json()
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+
+        other = django_user_model.objects.create_user(
+            username='TestOther', email='testother@yamdb.fake'
+        )
+        response = self.get_client(other).patch(url, data={'text': 'other'})
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что пользователь не может редактировать чужой отзыв.'
+        )
+        response = APIClient().patch(url, data={'text': 'anonymous'})
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+        for staff in (user, moderator, admin, user_superuser):
+            response = self.get_client(staff).patch(
+                url, data={'text': staff.username}
+            )
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что автор, модератор, администратор и '
+                'суперпользователь могут редактировать отзыв.'
+            )
+
+    def test_02_capabilities_resolved_once(self, user, moderator):
+        class CountingUser(ClaimsUser):
+            lookups = 0
+
+            @property
+            def role(self):
+                CountingUser.lookups += 1
+                return self.token.get('role')
+
+        permission = IsAuthorOrStaff()
+        reviews = [Review(pk=idx, author_id=user.pk) for idx in range(50)]
+        for owner, expected in ((user, 50), (moderator, 50)):
+            CountingUser.lookups = 0
+            request = Request(APIRequestFactory().patch('/'))
+            request.user = CountingUser(UserAccessToken.for_user(owner))
+            allowed = [
+                permission.has_object_permission(request, None, review)
+                for review in reviews
+            ]
+            assert sum(allowed) == expected
+            assert CountingUser.lookups == 1, (
+                'Проверьте, что права пользователя вычисляются один раз за '
+                'запрос, а не для каждого объекта.'
+            )
@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_with_queries(self, client, url, data):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, data)
+        return response, ' '.join(query['sql'] for query in context)
+
+    def test_01_titles_fields(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response, sql = self.get_with_queries(
+            client, self.TITLES_URL, {'fields': 'id,name'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'][0] == {
+            'id': titles[0]['id'], 'name': titles[0]['name']
+        }, (
+            f'Проверьте, что параметр `fields` на `{self.TITLES_URL}` '
+            'оставляет в ответе только перечисленные поля.'
+        )
+        assert '"description"' not in sql and 'reviews_genre' not in sql, (
+            'Проверьте, что параметр `fields` сокращает список загружаемых '
+            'из базы колонок.'
+        )
+
+        response = client.get(
+            f'{self.TITLES_URL}{titles[0]["id"]}/', {'fields': 'category'}
+        )
+        assert set(response.json()) == {'category'}
+        response = client.get(
+            f'{self.TITLES_URL}top/', {'fields': 'name,weighted_rating'}
+        )
+        assert set(response.json()['results'][0]) == {
+            'name', 'weighted_rating'
+        }
+
+    def test_02_reviews_fields(self, client, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 5)
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        response, sql = self.get_with_queries(
+            client, url, {'fields': 'author,score'}
+        )
+        assert response.json()['results'] == [
+            {'author': 'TestUser', 'score': 5}
+        ]
+        assert '"text"' not in sql, (
+            'Проверьте, что текст отзыва не загружается из базы, если он не '
+            'запрошен.'
+        )
+        response = client.get(url, {'fields': 'text', 'cursor': ''})
+        assert response.json()['results'] == [{'text': 'text'}]
+
+    def test_03_invalid_and_unsafe(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, {'fields': 'name,unknown'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что неизвестное поле в параметре `fields` приводит к '
+            'ошибке 400.'
+        )
+        assert response.json() == {'fields': ['Неизвестные поля: unknown.']}
+
+        response = admin_client.post(
+            '/api/v1/genres/?fields=slug',
+            data={'name': 'Мюзикл', 'slug': 'musical'},
+        )
+        assert response.json() == {'name': 'Мюзикл', 'slug': 'musical'}, (
+            'Проверьте, что параметр `fields` не влияет на небезопасные '
+            'запросы.'
+        )
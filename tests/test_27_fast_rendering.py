@@ -0,0 +1,67 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api import renderers
+from reviews.models import Title
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27FastRendering:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLE_FIELDS = 'id,name,year,rating,description,genre,category'
+    REVIEW_FIELDS = 'id,text,author,score,pub_date'
+
+    def test_01_titles_values_path(self, client, admin_client,
+                                   django_assert_num_queries):
+        create_titles(admin_client)
+        Title.objects.create(name='Без категории', year=2000)
+        with django_assert_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        expected = client.get(self.TITLES_URL, {'fields': self.TITLE_FIELDS})
+        assert response.json() == expected.json(), (
+            f'Проверьте, что быстрый путь списка `{self.TITLES_URL}` отдаёт '
+            'те же данные, что и `TitleSerializer`.'
+        )
+
+    def test_02_reviews_values_path(self, client, admin_client, user,
+                                    user_client, moderator, moderator_client):
+        _, titles = create_reviews(
+            admin_client, {user: user_client, moderator: moderator_client}
+        )
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        for params in ({}, {'cursor': ''}):
+            response = client.get(url, params)
+            expected = client.get(
+                url, {**params, 'fields': self.REVIEW_FIELDS}
+            )
+            assert response.json() == expected.json(), (
+                f'Проверьте, что быстрый путь списка `{url}` отдаёт те же '
+                'данные, что и `ReviewSerializer`.'
+            )
+
+    def test_03_renderer_fallback(self, client, admin_client, monkeypatch):
+        create_titles(admin_client)
+        fast = client.get(self.TITLES_URL)
+        monkeypatch.setattr(renderers, 'orjson', None)
+        slow = client.get(self.TITLES_URL)
+        assert json.loads(fast.content) == json.loads(slow.content), (
+            'Проверьте, что рендерер без `orjson` отдаёт тот же JSON.'
+        )
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT='application/json; indent=4'
+        )
+        assert b'\n    ' in response.content
+
+    def test_04_renderer_compat(self):
+        data = {'histogram': {1: 0, 10: 2}, 'text': 'a\u2028b\u2029c'}
+        content = renderers.FastJSONRenderer().render(data)
+        assert content == JSONRenderer().render(data), (
+            'Проверьте, что быстрый рендерер поддерживает нестроковые ключи '
+            'и экранирует U+2028 и U+2029, как `JSONRenderer`.'
+        )
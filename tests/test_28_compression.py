@@ -0,0 +1,72 @@
+import gzip
+import shutil
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from api import compression
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28Compression:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_gzip_above_threshold(self, client, admin_client, settings):
+        create_titles(admin_client)
+        settings.COMPRESSION_MIN_SIZE = 100
+        plain = client.get(self.TITLES_URL)
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='br;q=1, gzip;q=0.5'
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Encoding'] == 'gzip', (
+            'Проверьте, что ответы больше порога сжимаются gzip, если '
+            'клиент его принимает.'
+        )
+        assert 'Accept-Encoding' in response['Vary']
+        assert response['ETag'].startswith('W/')
+        assert gzip.decompress(response.content) == plain.content
+        assert not plain.has_header('Content-Encoding')
+
+        settings.COMPRESSION_MIN_SIZE = 100000
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert not response.has_header('Content-Encoding'), (
+            'Проверьте, что ответы меньше порога не сжимаются.'
+        )
+
+    def test_02_skip_streaming(self, admin_client, settings):
+        create_titles(admin_client)
+        settings.COMPRESSION_MIN_SIZE = 0
+        response = admin_client.get(
+            '/api/v1/export/titles.csv', HTTP_ACCEPT_ENCODING='gzip'
+        )
+        assert response.streaming
+        assert not response.has_header('Content-Encoding'), (
+            'Проверьте, что потоковые ответы не сжимаются.'
+        )
+
+    def test_03_negotiate(self, monkeypatch):
+        monkeypatch.setattr(compression, 'brotli', None)
+        assert compression.negotiate('gzip, deflate, br') == 'gzip'
+        assert compression.negotiate('gzip;q=0, identity') is None
+        assert compression.negotiate('*') == 'gzip'
+        assert compression.negotiate('') is None
+
+    def test_04_compress_static(self, tmp_path, settings):
+        shutil.copytree(settings.BASE_DIR / 'static', tmp_path / 'static')
+        settings.STATICFILES_DIRS = (tmp_path / 'static',)
+        call_command('compress_static', min_size=1024)
+        source = tmp_path / 'static' / 'redoc.yaml'
+        target = tmp_path / 'static' / 'redoc.yaml.gz'
+        assert gzip.decompress(target.read_bytes()) == source.read_bytes(), (
+            'Проверьте, что `compress_static` создаёт рядом с файлами '
+            'статики их gzip-версии.'
+        )
+        assert not (tmp_path / 'static' / 'data' / 'users.csv.gz').exists()
+
+        mtime = target.stat().st_mtime_ns
+        call_command('compress_static', min_size=1024)
+        assert target.stat().st_mtime_ns == mtime